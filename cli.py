@@ -756,8 +756,13 @@ class InteractiveCLI:
                 if not gh.is_authenticated():
                     print("\n❌ Not authenticated with GitHub.")
                     print("   Run: gh auth login")
-                    self.get_input("Press Enter...")
-                    return
+                    self.get_input("Press Enter to retry...")
+                    # Re-probe: the login happened outside this process
+                    gh.invalidate()
+                    if not gh.is_authenticated():
+                        print("\n❌ Still not authenticated with GitHub.")
+                        self.get_input("Press Enter...")
+                        return
                 
                 print(f"\n🔍 Looking up {repo_name}...")
                 github_repo = gh.get_repo(repo_name)
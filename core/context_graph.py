@@ -13,27 +13,87 @@ Key concepts:
 
 import os
 import json
+import time
+import queue
+import atexit
 import hashlib
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from statistics import fmean
+from collections import Counter, OrderedDict
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from typing import Optional, List, Dict, Any
 import yaml
 
 try:
     import chromadb
     from chromadb.config import Settings
+    from chromadb.utils import embedding_functions
     HAS_CHROMADB = True
 except ImportError:
     HAS_CHROMADB = False
 
 
+# Write-behind batching: the writer thread flushes after this many traces
+# or this many seconds, whichever comes first
+WRITE_BATCH_SIZE = 64
+WRITE_BATCH_INTERVAL = 0.1
+
+# Attempts at writing a trace file before the trace is dropped from the index
+WRITE_MAX_ATTEMPTS = 3
+
+# Buffered trace embeddings are added to Chroma once this many accumulate
+# or the write queue has been idle this many seconds
+EMBED_BATCH_SIZE = 32
+EMBED_IDLE_INTERVAL = 0.05
+
+
+# HNSW graph parameters for the decision trace collection. Chroma fixes
+# them when the collection is created, so changing them (or the
+# ContextGraph overrides) only affects a new store: delete the vectors/
+# directory and call rebuild_embeddings() to apply them to an existing one
+HNSW_M = 16
+HNSW_CONSTRUCTION_EF = 100
+HNSW_SEARCH_EF = 50
+
+
+# Precedent rendering for synthesize_precedents
+_OUTCOME_EMOJI = {"success": "✅", "partial_success": "⚠️", "failure": "❌"}
+_PRECEDENT_TEMPLATE = (
+    "### {index}. {project} ({similarity:.0%} similar)\n"
+    "**Context:** {context}\n"
+    "**Decision:** {decision}\n"
+    "**Outcome:** {emoji} {outcome} (score: {outcome_score:+.1f})\n"
+)
+
+
+def _format_precedent(index: int, p: "PrecedentMatch") -> str:
+    """Render one precedent as a markdown block"""
+    return _PRECEDENT_TEMPLATE.format_map({
+        "index": index,
+        "project": p.project,
+        "similarity": p.similarity,
+        "context": p.context,
+        "decision": p.decision,
+        "emoji": _OUTCOME_EMOJI.get(p.outcome, "❓"),
+        "outcome": p.outcome,
+        "outcome_score": p.outcome_score,
+    })
+
+
+# Number of context -> embedding vectors kept for repeated precedent queries
+EMBED_CACHE_SIZE = 256
+
+
 @dataclass
 class DecisionInput:
     """An input that influenced a decision"""
     type: str  # requirement, policy, code, precedent, context
     source: str  # file path, system name, or description
-    content_hash: str  # for deduplication
+    content_hash: str  # for deduplication - see ContextGraph.hash_file
     summary: str  # brief description
 
 
@@ -71,15 +131,15 @@ class DecisionTrace:
     context: str  # "Architecture review for payment integration"
     decision_type: str  # architecture, security, code_review, requirements, etc.
     
-    # Inputs that informed the decision
-    inputs: List[Dict]  # List of DecisionInput as dicts
+    # Inputs that informed the decision (plain dicts are accepted too)
+    inputs: List[DecisionInput]
     
     # Precedents considered
-    precedents_matched: List[Dict]  # List of PrecedentMatch as dicts
+    precedents_matched: List[PrecedentMatch]
     precedents_rejected: List[str]  # IDs of precedents considered but not applicable
     
     # The decision process
-    conflicts_resolved: List[Dict]  # List of ConflictResolution as dicts
+    conflicts_resolved: List[ConflictResolution]
     reasoning: str  # Full reasoning from the agent/voter
     
     # The outcome
@@ -105,6 +165,16 @@ class DecisionTrace:
     # Metadata
     tags: List[str] = field(default_factory=list)
     embedding: Optional[List[float]] = None  # Vector embedding for similarity search
+    
+    def to_dict(self) -> Dict:
+        """Serialize the trace, including nested inputs/precedents/conflicts"""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DecisionTrace":
+        """Rebuild a stored trace, ignoring keys this version doesn't know"""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
 
 
 class ContextGraph:
@@ -118,7 +188,19 @@ class ContextGraph:
     - Cross-project learning: "What can we learn from all past projects?"
     """
     
-    def __init__(self, storage_dir: str = "context_graph"):
+    def __init__(
+        self,
+        storage_dir: str = "context_graph",
+        hnsw_m: Optional[int] = None,
+        ef_construction: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ):
+        """
+        Args:
+            storage_dir: Directory for traces, index and vectors
+            hnsw_m, ef_construction, ef_search: HNSW overrides for the vector
+                store, applied only when its collection is first created
+        """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
         
@@ -131,27 +213,103 @@ class ContextGraph:
         self.index_file = self.storage_dir / "index.json"
         self.index = self._load_index()
         
+        # Parent -> child links live in an append-only sidecar instead of
+        # being rewritten into the parent trace file
+        self.edges_file = self.storage_dir / "edges.jsonl"
+        self._children = self._load_edges()
+        
         # Initialize vector store if available
         self.vector_store = None
+        self._embed_fn = None
+        self._embed_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._embed_lock = threading.Lock()
+        self._embed_buffer: List[tuple] = []
+        self._embed_buffer_lock = threading.Lock()
         if HAS_CHROMADB:
-            self._init_vector_store()
+            self._init_vector_store(hnsw_m, ef_construction, ef_search)
+        
+        # Write-behind queue - traces are persisted by a background thread
+        # so capture_decision only pays for an enqueue
+        self._index_lock = threading.Lock()
+        self._pending: Dict[str, DecisionTrace] = {}
+        self._write_attempts: Dict[str, int] = {}
+        # None is the stop sentinel put by close()
+        self._write_queue: "queue.Queue[Optional[DecisionTrace]]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="context-graph-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.flush)
+        
+        # Index files written before keyword/tag postings existed need a backfill
+        if "postings" not in self.index or "by_tag" not in self.index:
+            self._rebuild_postings()
     
-    def _init_vector_store(self):
+    def _init_vector_store(
+        self,
+        hnsw_m: Optional[int] = None,
+        ef_construction: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ):
         """Initialize ChromaDB for similarity search"""
+        # Library defaults (M=16, ef_search=10) give poor recall on small
+        # collections, so new collections get explicit HNSW parameters
+        hnsw = {
+            "hnsw:M": HNSW_M if hnsw_m is None else hnsw_m,
+            "hnsw:construction_ef": HNSW_CONSTRUCTION_EF if ef_construction is None else ef_construction,
+            "hnsw:search_ef": HNSW_SEARCH_EF if ef_search is None else ef_search,
+        }
+        
         try:
-            self.chroma_client = chromadb.Client(Settings(
-                chroma_db_impl="duckdb+parquet",
-                persist_directory=str(self.storage_dir / "vectors"),
-                anonymized_telemetry=False
-            ))
-            self.vector_store = self.chroma_client.get_or_create_collection(
-                name="decision_traces",
-                metadata={"hnsw:space": "cosine"}
+            self.chroma_client = chromadb.PersistentClient(
+                path=str(self.storage_dir / "vectors"),
+                settings=Settings(anonymized_telemetry=False)
             )
+            self._embed_fn = embedding_functions.DefaultEmbeddingFunction()
+            try:
+                # Existing collections keep the parameters they were built with
+                self.vector_store = self.chroma_client.get_collection(
+                    name="decision_traces",
+                    embedding_function=self._embed_fn,
+                )
+            except Exception:
+                self.vector_store = self.chroma_client.create_collection(
+                    name="decision_traces",
+                    metadata={"hnsw:space": "cosine", **hnsw},
+                    embedding_function=self._embed_fn,
+                )
         except Exception as e:
             print(f"Warning: Could not initialize vector store: {e}")
             self.vector_store = None
     
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts, reusing cached vectors and batching the misses.
+        
+        Cached vectors are packed as float16 bytes; both stored and
+        query embeddings pass through the cache, so they share precision.
+        """
+        keys = [hashlib.blake2b(t.encode(), digest_size=16).hexdigest() for t in texts]
+        
+        with self._embed_lock:
+            vectors = [self._embed_cache.get(k) for k in keys]
+        
+        missing = [i for i, v in enumerate(vectors) if v is None]
+        if missing:
+            computed = self._embed_fn([texts[i] for i in missing])
+            for i, vec in zip(missing, computed):
+                vec = [float(x) for x in vec]
+                vectors[i] = struct.pack(f"<{len(vec)}e", *vec)
+        
+        with self._embed_lock:
+            for key, vec in zip(keys, vectors):
+                self._embed_cache[key] = vec
+                self._embed_cache.move_to_end(key)
+            while len(self._embed_cache) > EMBED_CACHE_SIZE:
+                self._embed_cache.popitem(last=False)
+        
+        return [list(struct.unpack(f"<{len(v) // 2}e", v)) for v in vectors]
+    
     def _load_index(self) -> Dict:
         """Load the trace index"""
         if self.index_file.exists():
@@ -163,19 +321,143 @@ class ContextGraph:
             "by_type": {},  # decision_type -> [trace_ids]
             "by_actor": {},  # actor -> [trace_ids]
             "by_outcome": {},  # outcome -> [trace_ids]
+            "postings": {},  # keyword -> [trace_ids]
+            "token_counts": {},  # trace_id -> number of distinct keywords
+            "by_tag": {},  # tag -> [trace_ids]
         }
     
-    def _save_index(self):
-        """Save the trace index"""
-        with open(self.index_file, "w", encoding="utf-8") as f:
-            json.dump(self.index, f, indent=2)
+    def _save_index(self, pretty: bool = False):
+        """
+        Save the trace index (caller must hold _index_lock).
+        
+        Written compactly to a temp file and swapped in with os.replace, so
+        a crash mid-write never leaves a truncated index.json behind.
+        """
+        tmp_file = self.index_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            if pretty:
+                json.dump(self.index, f, indent=2)
+            else:
+                json.dump(self.index, f, separators=(",", ":"))
+        os.replace(tmp_file, self.index_file)
+    
+    def _writer_loop(self):
+        """Drain the write queue in batches of up to WRITE_BATCH_SIZE traces"""
+        while True:
+            # Wait indefinitely unless embeddings are buffered, in which case
+            # an idle queue is the signal to push them to the vector store
+            timeout = EMBED_IDLE_INTERVAL if self._embed_buffer else None
+            try:
+                batch = [self._write_queue.get(timeout=timeout)]
+            except queue.Empty:
+                self._flush_embed_buffer()
+                continue
+            
+            deadline = time.monotonic() + WRITE_BATCH_INTERVAL
+            while len(batch) < WRITE_BATCH_SIZE and batch[-1] is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            stop = batch[-1] is None
+            traces = [trace for trace in batch if trace is not None]
+            try:
+                if traces:
+                    self._write_batch(traces)
+            except Exception as e:
+                print(f"Warning: Could not write trace batch: {e}")
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+            
+            if stop:
+                self._flush_embed_buffer()
+                return
+    
+    def _write_batch(self, traces: List[DecisionTrace]):
+        """Persist a batch of traces with one index save"""
+        # One bad trace must not cost the rest of the batch. Failed traces
+        # stay in _pending and are queued again; after WRITE_MAX_ATTEMPTS
+        # they are dropped from the index so it never lists a missing file.
+        saved = []
+        dropped = []
+        for trace in traces:
+            try:
+                self._save_trace(trace)
+            except Exception as e:
+                attempts = self._write_attempts.get(trace.trace_id, 0) + 1
+                if attempts < WRITE_MAX_ATTEMPTS:
+                    self._write_attempts[trace.trace_id] = attempts
+                    # Queued before this batch's task_done, so flush() waits
+                    self._write_queue.put(trace)
+                else:
+                    print(f"Warning: Could not write trace {trace.trace_id}, dropping it: {e}")
+                    dropped.append(trace)
+                continue
+            self._pending.pop(trace.trace_id, None)
+            self._write_attempts.pop(trace.trace_id, None)
+            saved.append(trace)
+        
+        if not saved and not dropped:
+            return
+        
+        try:
+            self._append_edges([(t.parent_trace, t.trace_id) for t in saved if t.parent_trace])
+        finally:
+            with self._index_lock:
+                for trace in dropped:
+                    self._unindex_trace_locked(trace)
+                    self._pending.pop(trace.trace_id, None)
+                    self._write_attempts.pop(trace.trace_id, None)
+                self._save_index()
+        
+        if self.vector_store:
+            for trace in saved:
+                self._embed_trace(trace)
+            if len(self._embed_buffer) >= EMBED_BATCH_SIZE:
+                self._flush_embed_buffer()
+    
+    def flush(self):
+        """Block until all queued traces are on disk and in the vector store"""
+        self._write_queue.join()
+        self._flush_embed_buffer()
+    
+    def close(self):
+        """Flush queued traces and stop the background writer"""
+        if not self._writer.is_alive():
+            return
+        self.flush()
+        self._write_queue.put(None)
+        self._writer.join()
+        atexit.unregister(self.flush)
     
     def _generate_trace_id(self, context: str, timestamp: str) -> str:
         """Generate unique trace ID"""
         content = f"{context}:{timestamp}"
-        hash_val = hashlib.sha256(content.encode()).hexdigest()[:12]
+        # Non-cryptographic use: a 48-bit blake2b digest is enough and cheaper
+        hash_val = hashlib.blake2b(content.encode(), digest_size=6).hexdigest()
         return f"TRACE-{hash_val.upper()}"
     
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """
+        Hash a file for DecisionInput.content_hash.
+        
+        Streams the file through blake2b in 1 MiB chunks rather than reading
+        it into memory first - use this for policy docs and other large inputs.
+        """
+        with open(path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "blake2b", _bufsize=1 << 20).hexdigest()
+            digest = hashlib.blake2b()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+            return digest.hexdigest()
+    
     # ════════════════════════════════════════════════════════════
     # CAPTURE - Recording decisions
     # ════════════════════════════════════════════════════════════
@@ -214,10 +496,10 @@ class ContextGraph:
             feature_id=feature_id,
             context=context,
             decision_type=decision_type,
-            inputs=[asdict(i) if isinstance(i, DecisionInput) else i for i in inputs],
-            precedents_matched=[asdict(p) if isinstance(p, PrecedentMatch) else p for p in (precedents_matched or [])],
+            inputs=list(inputs),
+            precedents_matched=list(precedents_matched or []),
             precedents_rejected=[],
-            conflicts_resolved=[asdict(c) if isinstance(c, ConflictResolution) else c for c in (conflicts_resolved or [])],
+            conflicts_resolved=list(conflicts_resolved or []),
             reasoning=reasoning,
             decision=decision,
             decision_summary=decision_summary,
@@ -228,15 +510,15 @@ class ContextGraph:
             tags=tags or [],
         )
         
-        # Save trace
-        self._save_trace(trace)
-        
-        # Update index
+        # Update in-memory index so queries see the trace immediately
         self._index_trace(trace)
         
-        # Update parent if exists
         if parent_trace:
-            self._add_child_trace(parent_trace, trace_id)
+            self._children.setdefault(parent_trace, []).append(trace_id)
+        
+        # Queue trace (and parent link) for the background writer
+        self._pending[trace_id] = trace
+        self._write_queue.put(trace)
         
         return trace
     
@@ -244,10 +526,14 @@ class ContextGraph:
         """Save a trace to disk"""
         trace_file = self.storage_dir / "traces" / f"{trace.trace_id}.yaml"
         with open(trace_file, "w", encoding="utf-8") as f:
-            yaml.dump(asdict(trace), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(trace.to_dict(), f, default_flow_style=False, sort_keys=False)
     
     def _index_trace(self, trace: DecisionTrace):
-        """Add trace to index"""
+        """Add trace to the in-memory index"""
+        with self._index_lock:
+            self._index_trace_locked(trace)
+    
+    def _index_trace_locked(self, trace: DecisionTrace):
         # Main index
         self.index["traces"][trace.trace_id] = {
             "project_id": trace.project_id,
@@ -256,6 +542,9 @@ class ContextGraph:
             "actor": trace.actor,
             "timestamp": trace.timestamp,
             "context": trace.context[:100],
+            "decision_summary": trace.decision_summary[:50],
+            "outcome": trace.outcome,
+            "outcome_score": trace.outcome_score,
         }
         
         # By project
@@ -273,15 +562,77 @@ class ContextGraph:
             self.index["by_actor"][trace.actor] = []
         self.index["by_actor"][trace.actor].append(trace.trace_id)
         
-        self._save_index()
+        # Keyword and tag postings for _keyword_search / get_tribal_knowledge
+        self._index_postings(
+            trace.trace_id, trace.context, trace.decision_summary, trace.tags
+        )
+    
+    def _unindex_trace_locked(self, trace: DecisionTrace):
+        """Remove a trace added by _index_trace_locked (caller holds _index_lock)"""
+        trace_id = trace.trace_id
+        self.index["traces"].pop(trace_id, None)
         
-        # Add to vector store if available
-        if self.vector_store:
-            self._embed_trace(trace)
+        for field_name, value in (
+            ("by_project", trace.project_id),
+            ("by_type", trace.decision_type),
+            ("by_actor", trace.actor),
+        ):
+            ids = self.index[field_name].get(value)
+            if ids and trace_id in ids:
+                ids.remove(trace_id)
+        
+        for token in set(f"{trace.context} {trace.decision_summary} {' '.join(trace.tags)}".lower().split()):
+            ids = self.index["postings"].get(token)
+            if ids and trace_id in ids:
+                ids.remove(trace_id)
+        self.index["token_counts"].pop(trace_id, None)
+        for tag in set(trace.tags):
+            ids = self.index["by_tag"].get(tag)
+            if ids and trace_id in ids:
+                ids.remove(trace_id)
+        
+        if trace.parent_trace:
+            children = self._children.get(trace.parent_trace)
+            if children and trace_id in children:
+                children.remove(trace_id)
+    
+    def _index_postings(self, trace_id: str, context: str, summary: str, tags: List[str]):
+        """Add a trace's keywords and tags to the inverted indexes"""
+        tokens = set(f"{context} {summary} {' '.join(tags)}".lower().split())
+        postings = self.index.setdefault("postings", {})
+        for token in tokens:
+            postings.setdefault(token, []).append(trace_id)
+        self.index.setdefault("token_counts", {})[trace_id] = len(tokens)
+        
+        by_tag = self.index.setdefault("by_tag", {})
+        for tag in set(tags):
+            by_tag.setdefault(tag, []).append(trace_id)
+    
+    def _rebuild_postings(self):
+        """Rebuild keyword and tag postings from the trace files on disk"""
+        with self._index_lock:
+            self.index["postings"] = {}
+            self.index["token_counts"] = {}
+            self.index["by_tag"] = {}
+            for trace_id in self.index["traces"]:
+                trace = self.get_trace(trace_id)
+                if trace:
+                    self._index_postings(
+                        trace_id,
+                        trace["context"],
+                        trace["decision_summary"],
+                        trace.get("tags", []),
+                    )
+            self._save_index()
     
     def _embed_trace(self, trace: DecisionTrace):
-        """Add trace to vector store for similarity search"""
-        # Create searchable text
+        """Buffer a trace for the next batched vector store add"""
+        record = self._embedding_record(trace)
+        with self._embed_buffer_lock:
+            self._embed_buffer.append(record)
+    
+    def _embedding_record(self, trace: DecisionTrace) -> tuple:
+        """Build the (id, searchable text, metadata) triple for a trace"""
         search_text = f"""
         Context: {trace.context}
         Type: {trace.decision_type}
@@ -289,30 +640,51 @@ class ContextGraph:
         Reasoning: {trace.reasoning[:500]}
         Tags: {', '.join(trace.tags)}
         """
+        metadata = {
+            "project_id": trace.project_id,
+            "decision_type": trace.decision_type,
+            "decision": trace.decision,
+            "outcome": trace.outcome or "pending",
+            "outcome_score": trace.outcome_score,
+        }
+        return trace.trace_id, search_text, metadata
+    
+    def _flush_embed_buffer(self):
+        """Add all buffered traces to the vector store in a single call"""
+        with self._embed_buffer_lock:
+            buffered, self._embed_buffer = self._embed_buffer, []
+        if not buffered:
+            return
         
+        ids, documents, metadatas = zip(*buffered)
         try:
             self.vector_store.add(
-                documents=[search_text],
-                ids=[trace.trace_id],
-                metadatas=[{
-                    "project_id": trace.project_id,
-                    "decision_type": trace.decision_type,
-                    "decision": trace.decision,
-                    "outcome": trace.outcome or "pending",
-                    "outcome_score": trace.outcome_score,
-                }]
+                documents=list(documents),
+                embeddings=self._embed(list(documents)),
+                ids=list(ids),
+                metadatas=list(metadatas),
             )
         except Exception as e:
-            print(f"Warning: Could not embed trace: {e}")
+            print(f"Warning: Could not embed traces: {e}")
     
-    def _add_child_trace(self, parent_id: str, child_id: str):
-        """Add child trace to parent"""
-        trace = self.get_trace(parent_id)
-        if trace:
-            trace["child_traces"].append(child_id)
-            trace_file = self.storage_dir / "traces" / f"{parent_id}.yaml"
-            with open(trace_file, "w", encoding="utf-8") as f:
-                yaml.dump(trace, f, default_flow_style=False, sort_keys=False)
+    def _load_edges(self) -> Dict[str, List[str]]:
+        """Load the parent -> children map from edges.jsonl"""
+        children: Dict[str, List[str]] = {}
+        if self.edges_file.exists():
+            with open(self.edges_file, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        edge = json.loads(line)
+                        children.setdefault(edge["parent"], []).append(edge["child"])
+        return children
+    
+    def _append_edges(self, edges: List[tuple]):
+        """Append (parent_id, child_id) links to edges.jsonl"""
+        if not edges:
+            return
+        with open(self.edges_file, "a", encoding="utf-8") as f:
+            for parent_id, child_id in edges:
+                f.write(json.dumps({"parent": parent_id, "child": child_id}) + "\n")
     
     # ════════════════════════════════════════════════════════════
     # OUTCOME - Recording results
@@ -336,6 +708,9 @@ class ContextGraph:
             outcome_score: -1.0 (total failure) to 1.0 (total success)
             notes: Additional context about the outcome
         """
+        # Make sure the background writer is not holding a stale copy
+        self.flush()
+        
         trace = self.get_trace(trace_id)
         if not trace:
             return
@@ -351,10 +726,15 @@ class ContextGraph:
             yaml.dump(trace, f, default_flow_style=False, sort_keys=False)
         
         # Update index
-        if outcome not in self.index["by_outcome"]:
-            self.index["by_outcome"][outcome] = []
-        self.index["by_outcome"][outcome].append(trace_id)
-        self._save_index()
+        with self._index_lock:
+            if outcome not in self.index["by_outcome"]:
+                self.index["by_outcome"][outcome] = []
+            self.index["by_outcome"][outcome].append(trace_id)
+            meta = self.index["traces"].get(trace_id)
+            if meta is not None:
+                meta["outcome"] = outcome
+                meta["outcome_score"] = outcome_score
+            self._save_index()
         
         # Update vector store metadata
         if self.vector_store:
@@ -372,17 +752,80 @@ class ContextGraph:
             except:
                 pass
     
+    # ════════════════════════════════════════════════════════════
+    # REBUILD - Recovery and bulk import
+    # ════════════════════════════════════════════════════════════
+    
+    def rebuild_embeddings(self, batch_size: int = 64, max_workers: int = 8) -> int:
+        """
+        Re-embed every indexed trace into the vector store.
+        
+        Use after restoring traces from backup or importing them in bulk.
+        Traces are split into batches that are embedded and upserted
+        concurrently; Chroma handles adds for disjoint IDs from threads.
+        
+        Returns:
+            Number of traces written to the vector store
+        """
+        if not self.vector_store:
+            return 0
+        
+        self.flush()
+        trace_ids = list(self.index["traces"])
+        batches = [trace_ids[i:i + batch_size] for i in range(0, len(trace_ids), batch_size)]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return sum(executor.map(self._batch_embed_and_add, batches))
+    
+    def _batch_embed_and_add(self, trace_ids: List[str]) -> int:
+        """Embed one batch of stored traces and upsert it into the vector store"""
+        records = []
+        for trace_id in trace_ids:
+            try:
+                trace = self.get_trace(trace_id)
+                if trace:
+                    records.append(self._embedding_record(DecisionTrace.from_dict(trace)))
+            except Exception as e:
+                # One unreadable or outdated trace must not sink the batch
+                print(f"Warning: Could not load trace {trace_id}: {e}")
+        if not records:
+            return 0
+        
+        ids, documents, metadatas = zip(*records)
+        try:
+            self.vector_store.upsert(
+                documents=list(documents),
+                embeddings=self._embed(list(documents)),
+                ids=list(ids),
+                metadatas=list(metadatas),
+            )
+        except Exception as e:
+            print(f"Warning: Could not embed traces: {e}")
+            return 0
+        return len(records)
+    
     # ════════════════════════════════════════════════════════════
     # QUERY - Finding precedents
     # ════════════════════════════════════════════════════════════
     
     def get_trace(self, trace_id: str) -> Optional[Dict]:
         """Get a single trace by ID"""
-        trace_file = self.storage_dir / "traces" / f"{trace_id}.yaml"
-        if trace_file.exists():
+        pending = self._pending.get(trace_id)
+        if pending is not None:
+            trace = pending.to_dict()
+        else:
+            trace_file = self.storage_dir / "traces" / f"{trace_id}.yaml"
+            if not trace_file.exists():
+                return None
             with open(trace_file, encoding="utf-8") as f:
-                return yaml.safe_load(f)
-        return None
+                trace = yaml.safe_load(f)
+        
+        # Merge child links recorded in edges.jsonl
+        children = self._children.get(trace_id)
+        if children:
+            known = trace.setdefault("child_traces", [])
+            known.extend(c for c in children if c not in known)
+        return trace
     
     def find_precedents(
         self,
@@ -410,31 +853,38 @@ class ContextGraph:
         # Use vector search if available
         if self.vector_store:
             try:
-                where_filter = {}
+                conditions = []
                 if decision_type:
-                    where_filter["decision_type"] = decision_type
+                    conditions.append({"decision_type": decision_type})
                 if min_outcome_score > -1.0:
-                    where_filter["outcome_score"] = {"$gte": min_outcome_score}
+                    conditions.append({"outcome_score": {"$gte": min_outcome_score}})
+                if exclude_project:
+                    conditions.append({"project_id": {"$ne": exclude_project}})
+                
+                if len(conditions) > 1:
+                    where_filter = {"$and": conditions}
+                else:
+                    where_filter = conditions[0] if conditions else None
                 
+                # Filtering happens in Chroma, so results arrive ranked and
+                # already exclude the caller's project
                 results = self.vector_store.query(
-                    query_texts=[context],
-                    n_results=limit * 2,  # Get extra to filter
-                    where=where_filter if where_filter else None,
+                    query_embeddings=self._embed([context]),
+                    n_results=limit,
+                    where=where_filter,
                 )
                 
-                for i, trace_id in enumerate(results["ids"][0]):
+                ids = results["ids"][0]
+                if results["distances"]:
+                    similarities = [1 - d for d in results["distances"][0]]
+                else:
+                    similarities = [0.5] * len(ids)
+                
+                for trace_id, similarity in zip(ids, similarities):
                     trace = self.get_trace(trace_id)
                     if not trace:
                         continue
                     
-                    # Skip if same project
-                    if exclude_project and trace["project_id"] == exclude_project:
-                        continue
-                    
-                    # Calculate similarity from distance
-                    distance = results["distances"][0][i] if results["distances"] else 0.5
-                    similarity = 1 - distance
-                    
                     matches.append(PrecedentMatch(
                         trace_id=trace_id,
                         project=trace["project_id"],
@@ -444,16 +894,15 @@ class ContextGraph:
                         outcome=trace.get("outcome", "pending"),
                         outcome_score=trace.get("outcome_score", 0.0),
                     ))
-                    
-                    if len(matches) >= limit:
-                        break
+                
+                if matches:
+                    return matches
                         
             except Exception as e:
                 print(f"Vector search failed, falling back to keyword search: {e}")
         
-        # Fallback to keyword search if no vector results
-        if not matches:
-            matches = self._keyword_search(context, decision_type, limit, exclude_project)
+        # Fallback to keyword search only when vector search found nothing
+        matches = self._keyword_search(context, decision_type, limit, exclude_project)
         
         return sorted(matches, key=lambda m: m.similarity, reverse=True)[:limit]
     
@@ -464,41 +913,41 @@ class ContextGraph:
         limit: int,
         exclude_project: Optional[str],
     ) -> List[PrecedentMatch]:
-        """Simple keyword-based precedent search"""
+        """Keyword-based precedent search over the inverted index"""
         matches = []
         keywords = set(context.lower().split())
+        postings = self.index.get("postings", {})
+        token_counts = self.index.get("token_counts", {})
+        
+        # Count keyword hits per candidate - only traces sharing a keyword
+        overlaps: Dict[str, int] = {}
+        for keyword in keywords:
+            for trace_id in postings.get(keyword, ()):
+                overlaps[trace_id] = overlaps.get(trace_id, 0) + 1
         
-        # Get relevant trace IDs
-        trace_ids = []
         if decision_type and decision_type in self.index["by_type"]:
-            trace_ids = self.index["by_type"][decision_type]
-        else:
-            trace_ids = list(self.index["traces"].keys())
+            allowed = set(self.index["by_type"][decision_type])
+            overlaps = {tid: n for tid, n in overlaps.items() if tid in allowed}
         
-        for trace_id in trace_ids:
-            trace = self.get_trace(trace_id)
-            if not trace:
+        for trace_id, overlap in overlaps.items():
+            meta = self.index["traces"].get(trace_id, {})
+            if exclude_project and meta.get("project_id") == exclude_project:
                 continue
             
-            if exclude_project and trace["project_id"] == exclude_project:
+            trace = self.get_trace(trace_id)
+            if not trace:
                 continue
             
-            # Simple keyword overlap scoring
-            trace_text = f"{trace['context']} {trace['decision_summary']} {' '.join(trace.get('tags', []))}".lower()
-            trace_keywords = set(trace_text.split())
-            overlap = len(keywords & trace_keywords)
-            
-            if overlap > 0:
-                similarity = overlap / max(len(keywords), len(trace_keywords))
-                matches.append(PrecedentMatch(
-                    trace_id=trace_id,
-                    project=trace["project_id"],
-                    similarity=similarity,
-                    context=trace["context"],
-                    decision=trace["decision_summary"],
-                    outcome=trace.get("outcome", "pending"),
-                    outcome_score=trace.get("outcome_score", 0.0),
-                ))
+            similarity = overlap / max(len(keywords), token_counts.get(trace_id, overlap))
+            matches.append(PrecedentMatch(
+                trace_id=trace_id,
+                project=trace["project_id"],
+                similarity=similarity,
+                context=trace["context"],
+                decision=trace["decision_summary"],
+                outcome=trace.get("outcome", "pending"),
+                outcome_score=trace.get("outcome_score", 0.0),
+            ))
         
         return matches
     
@@ -521,38 +970,32 @@ class ContextGraph:
         if not trace_ids:
             return {"error": "No traces found for this type"}
         
-        traces = [self.get_trace(tid) for tid in trace_ids]
-        traces = [t for t in traces if t]
+        # Aggregate from the in-memory index; only traces indexed before
+        # outcome fields were stored there need a disk read
+        entries = [self._pattern_entry(tid) for tid in trace_ids]
+        entries = [e for e in entries if e]
         
-        # Analyze outcomes
-        outcomes = {}
-        total_score = 0
-        scored_count = 0
+        outcomes = Counter(e.get("outcome", "pending") for e in entries)
+        scores = [e["outcome_score"] for e in entries if e.get("outcome_score")]
+        avg_score = fmean(scores) if scores else None
         
-        for trace in traces:
-            outcome = trace.get("outcome", "pending")
-            outcomes[outcome] = outcomes.get(outcome, 0) + 1
-            
-            if trace.get("outcome_score"):
-                total_score += trace["outcome_score"]
-                scored_count += 1
-        
-        avg_score = total_score / scored_count if scored_count > 0 else None
-        
-        # Find common decisions
-        decisions = {}
-        for trace in traces:
-            summary = trace.get("decision_summary", "")[:50]
-            decisions[summary] = decisions.get(summary, 0) + 1
+        decisions = Counter(e.get("decision_summary", "")[:50] for e in entries)
         
         return {
             "decision_type": decision_type,
-            "total_traces": len(traces),
-            "outcome_distribution": outcomes,
+            "total_traces": len(entries),
+            "outcome_distribution": dict(outcomes),
             "average_outcome_score": avg_score,
-            "common_decisions": dict(sorted(decisions.items(), key=lambda x: x[1], reverse=True)[:5]),
+            "common_decisions": dict(decisions.most_common(5)),
         }
     
+    def _pattern_entry(self, trace_id: str) -> Optional[Dict]:
+        """Index metadata for a trace, falling back to the trace file"""
+        meta = self.index["traces"].get(trace_id)
+        if meta and "outcome_score" in meta:
+            return meta
+        return self.get_trace(trace_id)
+    
     # ════════════════════════════════════════════════════════════
     # SYNTHESIS - Generating insights
     # ════════════════════════════════════════════════════════════
@@ -567,15 +1010,7 @@ class ContextGraph:
             return "No relevant precedents found."
         
         lines = ["## Relevant Precedents\n"]
-        
-        for i, p in enumerate(precedents, 1):
-            outcome_emoji = "✅" if p.outcome_score > 0.5 else "⚠️" if p.outcome_score > 0 else "❌" if p.outcome_score < 0 else "❓"
-            
-            lines.append(f"### {i}. {p.project} ({p.similarity:.0%} similar)")
-            lines.append(f"**Context:** {p.context}")
-            lines.append(f"**Decision:** {p.decision}")
-            lines.append(f"**Outcome:** {outcome_emoji} {p.outcome} (score: {p.outcome_score:+.1f})")
-            lines.append("")
+        lines.extend(_format_precedent(i, p) for i, p in enumerate(precedents, 1))
         
         # Add summary
         successful = [p for p in precedents if p.outcome_score > 0.5]
@@ -597,21 +1032,27 @@ class ContextGraph:
         - "Dave's clients prefer weekly progress reports"
         """
         knowledge = []
+        seen = set()
+        by_tag = self.index.get("by_tag", {})
         
-        # Search traces with matching tags
-        for trace_id, meta in self.index["traces"].items():
+        # Only traces carrying one of the tags are read
+        candidate_ids = dict.fromkeys(tid for tag in tags for tid in by_tag.get(tag, ()))
+        
+        for trace_id in candidate_ids:
             trace = self.get_trace(trace_id)
             if not trace:
                 continue
             
-            trace_tags = set(trace.get("tags", []))
-            if trace_tags & set(tags):
-                # Extract exception patterns from conflicts
-                for conflict in trace.get("conflicts_resolved", []):
-                    if conflict.get("reasoning"):
-                        knowledge.append(conflict["reasoning"])
-        
-        return list(set(knowledge))[:10]  # Dedupe and limit
+            # Extract exception patterns from conflicts
+            for conflict in trace.get("conflicts_resolved", []):
+                reasoning = conflict.get("reasoning")
+                if reasoning and reasoning not in seen:
+                    seen.add(reasoning)
+                    knowledge.append(reasoning)
+                    if len(knowledge) >= 10:
+                        return knowledge
+        
+        return knowledge
 
 
 # ════════════════════════════════════════════════════════════
@@ -8,16 +8,204 @@ This captures the "Reality (Event Clock)" - the actual conversations and
 decisions that happen outside the System of Record.
 """
 
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Iterator, Pattern, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
+from collections import OrderedDict
+from bisect import bisect_right
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import json
+import mmap
+import os
+import re
+import time
 
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
 
-@dataclass
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+
+_NEWLINE_RE = re.compile("\n")
+
+# Max transcript files read concurrently by _gather_from_transcripts
+TRANSCRIPT_READ_CONCURRENCY = 32
+
+# Seconds a single source's query results are reused by async_ttl_cache
+SOURCE_CACHE_TTL = 60.0
+
+# Thread pool size for SimpleSynthesizer._scan_project_notes
+NOTE_READ_WORKERS = 32
+
+# Keyword language used by _synthesize to classify signals
+DECISION_KEYWORDS = frozenset(["decided", "approved", "agreed", "go with", "chosen", "selected"])
+CONCERN_KEYWORDS = frozenset(["worried", "concern", "risk", "issue", "problem", "careful"])
+REQUIREMENT_KEYWORDS = frozenset(["must", "need to", "require", "should", "have to"])
+TRIBAL_KEYWORDS = frozenset(["always", "never", "we usually", "dave prefers", "the client wants"])
+
+_SIGNAL_CLASS_RE = re.compile("|".join(
+    f"(?P<{name}>{'|'.join(map(re.escape, sorted(keywords)))})"
+    for name, keywords in (
+        ("dec", DECISION_KEYWORDS),
+        ("con", CONCERN_KEYWORDS),
+        ("req", REQUIREMENT_KEYWORDS),
+        ("tri", TRIBAL_KEYWORDS),
+    )
+), re.IGNORECASE)
+
+
+def _compile_terms(search_terms: List[str]) -> Pattern:
+    """Compile search terms into one lowercase alternation regex"""
+    return re.compile("|".join(re.escape(term.lower()) for term in search_terms))
+
+
+def _compile_probe(search_terms: List[str]) -> Optional[Pattern]:
+    """
+    Compile search terms into a case-insensitive bytes regex for probing
+    raw files. Returns None when a term is non-ASCII, since bytes patterns
+    only fold ASCII case.
+    """
+    if not all(term.isascii() for term in search_terms):
+        return None
+    return re.compile(
+        b"|".join(re.escape(term.encode()) for term in search_terms),
+        re.IGNORECASE,
+    )
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode JSON with orjson when available, else the stdlib"""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON with orjson when available, else the stdlib"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def async_ttl_cache(ttl: float):
+    """
+    Memoize an async `_gather_from_*(search_terms, days)` method per
+    instance for ttl seconds.
+    
+    The in-flight task is cached rather than its result, so concurrent
+    callers with the same query await one request. Entries are dropped if
+    the call raises or is cancelled, and tasks from an earlier event loop
+    are never reused.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(self, search_terms: List[str], days: int):
+            key = (fn.__name__, " ".join(sorted(search_terms)), days)
+            now = time.monotonic()
+            loop = asyncio.get_running_loop()
+            cache = self._source_cache
+            
+            cached = cache.get(key)
+            if cached and cached[0] > now and cached[1].get_loop() is loop:
+                return await asyncio.shield(cached[1])
+            
+            # Prune expired and other-loop entries while we're here
+            for stale in [
+                k for k, (expiry, task) in cache.items()
+                if expiry <= now or task.get_loop() is not loop
+            ]:
+                del cache[stale]
+            
+            task = asyncio.ensure_future(fn(self, search_terms, days))
+            task.add_done_callback(lambda t: _drop_failed_source(cache, key, t))
+            cache[key] = (now + ttl, task)
+            return await asyncio.shield(task)
+        return wrapper
+    return decorator
+
+
+def _drop_failed_source(cache: Dict[tuple, tuple], key: tuple, task: asyncio.Task):
+    """Evict a cached source query that failed so the next call retries"""
+    if task.cancelled() or task.exception() is not None:
+        cached = cache.get(key)
+        if cached and cached[1] is task:
+            del cache[key]
+
+
+@lru_cache(maxsize=32)
+def _hyperscan_db(search_terms: Tuple[str, ...]) -> "hyperscan.Database":
+    """Compile (and cache) a caseless Hyperscan database for the terms"""
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(term).encode() for term in search_terms],
+        ids=list(range(len(search_terms))),
+        elements=len(search_terms),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(search_terms),
+    )
+    return db
+
+
+def _hyperscan_match_lines(content: str, search_terms: Tuple[str, ...]) -> List[int]:
+    """Sorted indices of lines containing any term, via one Hyperscan scan"""
+    data = content.encode("utf-8", errors="ignore")
+    newline_offsets = [m.start() for m in re.finditer(b"\n", data)]
+    matched = set()
+    
+    def on_match(term_id, start, end, flags, context):
+        # Hyperscan reports match end offsets; the last byte decides the line
+        matched.add(bisect_right(newline_offsets, end - 1))
+    
+    _hyperscan_db(search_terms).scan(data, match_event_handler=on_match)
+    return sorted(matched)
+
+
+def _scan_files(directory: Path, suffix: str, recursive: bool = False) -> List[Tuple[Path, float]]:
+    """
+    List (path, mtime) for files ending in suffix using os.scandir, whose
+    DirEntry objects cache stat results - one syscall per file instead of
+    glob's type check plus a separate Path.stat().
+    """
+    found = []
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(suffix):
+                found.append((Path(entry.path), entry.stat().st_mtime))
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+    for subdir in subdirs:
+        found.extend(_scan_files(Path(subdir), suffix, recursive))
+    return found
+
+
+def _file_contains(path: Path, probe: Pattern) -> bool:
+    """Search a file's bytes via mmap without decoding it into a string"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return probe.search(mm) is not None
+
+
+@dataclass(slots=True)
 class ExternalSignal:
-    """A signal from an external system"""
+    """A signal from an external system (slotted - gathers can produce many)"""
     source: str  # slack, jira, email, meeting, github
     timestamp: str
     content: str
@@ -26,6 +214,19 @@ class ExternalSignal:
     url: Optional[str]
     relevance_score: float  # 0-1 how relevant to current context
     signal_type: str  # approval, concern, requirement, context, decision
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for caching/JSON (flat fields, so no recursive asdict)"""
+        return {
+            "source": self.source,
+            "timestamp": self.timestamp,
+            "content": self.content,
+            "author": self.author,
+            "channel": self.channel,
+            "url": self.url,
+            "relevance_score": self.relevance_score,
+            "signal_type": self.signal_type,
+        }
 
 
 @dataclass
@@ -38,6 +239,26 @@ class SynthesizedContext:
     concerns_raised: List[str]
     requirements_implied: List[str]
     tribal_knowledge: List[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the on-disk gather cache"""
+        return {
+            "summary": self.summary,
+            "signals": [signal.to_dict() for signal in self.signals],
+            "key_stakeholders": self.key_stakeholders,
+            "decisions_mentioned": self.decisions_mentioned,
+            "concerns_raised": self.concerns_raised,
+            "requirements_implied": self.requirements_implied,
+            "tribal_knowledge": self.tribal_knowledge,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SynthesizedContext":
+        """Rebuild a context written by to_dict"""
+        return cls(**{
+            **data,
+            "signals": [ExternalSignal(**signal) for signal in data["signals"]],
+        })
 
 
 class CrossSystemSynthesizer:
@@ -55,13 +276,106 @@ class CrossSystemSynthesizer:
     that never makes it into the System of Record.
     """
     
-    def __init__(self):
+    # Max in-flight requests per backend, so concurrent gathers from many
+    # projects don't trip rate limits or connection drops
+    DEFAULT_SOURCE_LIMITS = {"slack": 10, "jira": 10, "gmail": 5, "github": 10}
+    
+    def __init__(self, cache_ttl: float = 300.0, cache_size: int = 128):
+        """
+        Args:
+            cache_ttl: Seconds a gather_context result is reused
+            cache_size: Max cached gather_context results (LRU)
+        """
         self.mcp_clients = {}
-        self.signal_cache = {}
+        # (project, feature, keywords, window) -> (created, task)
+        self.signal_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        # One keep-alive connection pool shared by every HTTP-backed client,
+        # created on first use inside the event loop. Outside `async with`
+        # it lives only while gathers are in flight, since callers usually
+        # run each gather in its own asyncio.run() loop
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_context = False
+        self._active_gathers = 0
+        # Per-source query results, see async_ttl_cache
+        self._source_cache: Dict[tuple, tuple] = {}
+        # Per-source request limits. The semaphores themselves are made on
+        # first use inside the event loop, like the session, since a
+        # semaphore that was ever contended stays bound to its loop
+        self._source_limits = dict(self.DEFAULT_SOURCE_LIMITS)
+        self._sems: Dict[str, asyncio.Semaphore] = {}
+        self._sems_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def register_mcp_client(self, source: str, client: Any):
-        """Register an MCP client for a source"""
+        """
+        Register an MCP client for a source.
+        
+        Clients exposing set_session(session) receive the shared aiohttp
+        session instead of opening their own.
+        """
         self.mcp_clients[source] = client
+        if self._session is not None and hasattr(client, "set_session"):
+            client.set_session(self._session)
+    
+    async def _ensure_session(self):
+        """Create the shared HTTP session and hand it to supporting clients"""
+        if not HAS_AIOHTTP:
+            return
+        clients = [c for c in self.mcp_clients.values() if hasattr(c, "set_session")]
+        if not clients:
+            return
+        
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed:
+            if self._session_loop is loop:
+                return
+            # Made on an earlier event loop - unusable here, start afresh
+        
+        self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+            limit=100, limit_per_host=20, keepalive_timeout=30
+        ))
+        self._session_loop = loop
+        for client in clients:
+            client.set_session(self._session)
+    
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._session is not None:
+            session, self._session = self._session, None
+            self._session_loop = None
+            await session.close()
+    
+    async def __aenter__(self) -> "CrossSystemSynthesizer":
+        self._in_context = True
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self._in_context = False
+        await self.aclose()
+    
+    def configure_limits(self, **limits: int):
+        """
+        Set the max concurrent requests per source.
+        
+        Example: synthesizer.configure_limits(slack=4, gmail=2)
+        """
+        for source, limit in limits.items():
+            self._source_limits[source] = limit
+            self._sems.pop(source, None)
+    
+    def _sem(self, source: str) -> asyncio.Semaphore:
+        """The request semaphore for a source on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._sems_loop is not loop:
+            # Made on an earlier event loop - unusable here, start afresh
+            self._sems = {}
+            self._sems_loop = loop
+        sem = self._sems.get(source)
+        if sem is None:
+            sem = self._sems[source] = asyncio.Semaphore(self._source_limits[source])
+        return sem
     
     async def gather_context(
         self,
@@ -82,6 +396,104 @@ class CrossSystemSynthesizer:
         Returns:
             SynthesizedContext with aggregated information
         """
+        key = (project_name, feature_name, tuple(sorted(keywords or ())), time_window_days)
+        now = time.monotonic()
+        
+        # Reuse a recent result - or an in-flight gather, so concurrent
+        # callers with the same key share one round of requests
+        cached = self.signal_cache.get(key)
+        if cached and now - cached[0] < self.cache_ttl:
+            self.signal_cache.move_to_end(key)
+            if isinstance(cached[1], SynthesizedContext):  # loaded from disk
+                return cached[1]
+            return await asyncio.shield(cached[1])
+        
+        task = asyncio.ensure_future(self._gather_context_uncached(
+            project_name, feature_name, keywords, time_window_days
+        ))
+        task.add_done_callback(lambda t: self._drop_failed_gather(key, t))
+        self.signal_cache[key] = (now, task)
+        while len(self.signal_cache) > self.cache_size:
+            self.signal_cache.popitem(last=False)
+        
+        return await asyncio.shield(task)
+    
+    def _drop_failed_gather(self, key: tuple, task: asyncio.Task):
+        """Evict a cached gather that failed so the next call retries"""
+        if task.cancelled() or task.exception() is not None:
+            cached = self.signal_cache.get(key)
+            if cached and cached[1] is task:
+                del self.signal_cache[key]
+    
+    def persist_cache(self, path: str):
+        """
+        Write completed gather_context results to disk so a later process
+        can reuse them via load_cache. Uses orjson when installed.
+        """
+        now = time.monotonic()
+        entries = []
+        for key, (created, value) in self.signal_cache.items():
+            if isinstance(value, asyncio.Future):
+                if not value.done() or value.cancelled() or value.exception():
+                    continue
+                value = value.result()
+            project_name, feature_name, keywords, days = key
+            entries.append({
+                "key": [project_name, feature_name, list(keywords), days],
+                "age": now - created,
+                "context": value.to_dict(),
+            })
+        
+        Path(path).write_bytes(_json_dumps({"saved_at": time.time(), "entries": entries}))
+    
+    def load_cache(self, path: str):
+        """Load results written by persist_cache that are still within cache_ttl"""
+        cache_file = Path(path)
+        if not cache_file.exists():
+            return
+        
+        data = _json_loads(cache_file.read_bytes())
+        elapsed = time.time() - data["saved_at"]
+        now = time.monotonic()
+        
+        for entry in data["entries"]:
+            age = entry["age"] + elapsed
+            if age >= self.cache_ttl:
+                continue
+            project_name, feature_name, keywords, days = entry["key"]
+            key = (project_name, feature_name, tuple(keywords), days)
+            self.signal_cache[key] = (now - age, SynthesizedContext.from_dict(entry["context"]))
+        
+        while len(self.signal_cache) > self.cache_size:
+            self.signal_cache.popitem(last=False)
+    
+    async def _gather_context_uncached(
+        self,
+        project_name: str,
+        feature_name: Optional[str],
+        keywords: Optional[List[str]],
+        time_window_days: int,
+    ) -> SynthesizedContext:
+        """Query every source and synthesize - the body of gather_context"""
+        self._active_gathers += 1
+        try:
+            await self._ensure_session()
+            return await self._query_sources(project_name, feature_name, keywords, time_window_days)
+        finally:
+            self._active_gathers -= 1
+            # Without `async with` nobody else will close the session; do it
+            # once the last concurrent gather is done
+            if not self._in_context and not self._active_gathers:
+                await self.aclose()
+    
+    async def _query_sources(
+        self,
+        project_name: str,
+        feature_name: Optional[str],
+        keywords: Optional[List[str]],
+        time_window_days: int,
+    ) -> SynthesizedContext:
+        """Fan out to the sources and synthesize their signals"""
         signals = []
         
         # Build search terms
@@ -91,40 +503,32 @@ class CrossSystemSynthesizer:
         if keywords:
             search_terms.extend(keywords)
         
-        # Gather from each source
-        if "slack" in self.mcp_clients:
-            slack_signals = await self._gather_from_slack(
-                search_terms, time_window_days
-            )
-            signals.extend(slack_signals)
-        
-        if "jira" in self.mcp_clients:
-            jira_signals = await self._gather_from_jira(
-                search_terms, time_window_days
-            )
-            signals.extend(jira_signals)
-        
-        if "gmail" in self.mcp_clients:
-            email_signals = await self._gather_from_email(
-                search_terms, time_window_days
-            )
-            signals.extend(email_signals)
-        
-        if "github" in self.mcp_clients:
-            github_signals = await self._gather_from_github(
-                search_terms, time_window_days
-            )
-            signals.extend(github_signals)
+        # Fan out to every connected source at once - each is an independent
+        # network round-trip, so total latency is the slowest source
+        gatherers = {
+            "slack": self._gather_from_slack,
+            "jira": self._gather_from_jira,
+            "gmail": self._gather_from_email,
+            "github": self._gather_from_github,
+        }
+        tasks = [
+            asyncio.create_task(gather(search_terms, time_window_days))
+            for source, gather in gatherers.items()
+            if source in self.mcp_clients
+        ]
         
         # Also check local meeting transcripts
-        transcript_signals = self._gather_from_transcripts(
-            search_terms, time_window_days
-        )
-        signals.extend(transcript_signals)
+        tasks.append(self._gather_from_transcripts(search_terms, time_window_days))
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, list):
+                signals.extend(result)
         
         # Synthesize into coherent context
         return self._synthesize(signals, project_name, feature_name)
     
+    @async_ttl_cache(SOURCE_CACHE_TTL)
     async def _gather_from_slack(
         self,
         search_terms: List[str],
@@ -140,17 +544,19 @@ class CrossSystemSynthesizer:
         try:
             # Search Slack messages
             query = " ".join(search_terms)
-            # This would call the actual MCP client
-            # results = await client.search_messages(query, days=days)
-            
-            # For now, return empty - actual implementation would parse results
-            pass
+            async with self._sem("slack"):
+                # This would call the actual MCP client
+                # results = await client.search_messages(query, days=days)
+                
+                # For now, return empty - actual implementation would parse results
+                pass
             
         except Exception as e:
             print(f"Slack search failed: {e}")
         
         return signals
     
+    @async_ttl_cache(SOURCE_CACHE_TTL)
     async def _gather_from_jira(
         self,
         search_terms: List[str],
@@ -165,14 +571,16 @@ class CrossSystemSynthesizer:
         
         try:
             # Search Jira issues
-            # JQL query would go here
-            pass
+            async with self._sem("jira"):
+                # JQL query would go here
+                pass
             
         except Exception as e:
             print(f"Jira search failed: {e}")
         
         return signals
     
+    @async_ttl_cache(SOURCE_CACHE_TTL)
     async def _gather_from_email(
         self,
         search_terms: List[str],
@@ -187,13 +595,15 @@ class CrossSystemSynthesizer:
         
         try:
             # Search Gmail
-            pass
+            async with self._sem("gmail"):
+                pass
             
         except Exception as e:
             print(f"Email search failed: {e}")
         
         return signals
     
+    @async_ttl_cache(SOURCE_CACHE_TTL)
     async def _gather_from_github(
         self,
         search_terms: List[str],
@@ -208,84 +618,164 @@ class CrossSystemSynthesizer:
         
         try:
             # Search GitHub
-            pass
+            async with self._sem("github"):
+                pass
             
         except Exception as e:
             print(f"GitHub search failed: {e}")
         
         return signals
     
-    def _gather_from_transcripts(
+    async def _gather_from_transcripts(
         self,
         search_terms: List[str],
         days: int
     ) -> List[ExternalSignal]:
         """Gather signals from local meeting transcripts"""
-        signals = []
-        
-        from pathlib import Path
         transcripts_dir = Path("transcripts")
         
         if not transcripts_dir.exists():
-            return signals
+            return []
+        
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
+        matcher = _compile_terms(search_terms)
+        probe = _compile_probe(search_terms)
+        
+        # Filesystem work runs in worker threads so it never blocks the MCP
+        # fetches sharing the event loop; the semaphore bounds open files
+        transcript_files = await asyncio.to_thread(_scan_files, transcripts_dir, ".txt")
+        limit = asyncio.Semaphore(TRANSCRIPT_READ_CONCURRENCY)
+        
+        async def scan(transcript_file: Path, mtime: float) -> List[ExternalSignal]:
+            async with limit:
+                return await asyncio.to_thread(
+                    self._scan_transcript_file,
+                    transcript_file, mtime, search_terms, matcher, probe,
+                )
         
-        cutoff = datetime.now() - timedelta(days=days)
+        # Drop stale transcripts on the cached mtime before any file is opened
+        results = await asyncio.gather(*(
+            scan(path, mtime) for path, mtime in transcript_files if mtime >= cutoff_ts
+        ))
+        return [signal for file_signals in results for signal in file_signals]
+    
+    def _scan_transcript_file(
+        self,
+        transcript_file: Path,
+        mtime: float,
+        search_terms: List[str],
+        matcher: Pattern,
+        probe: Optional[Pattern] = None,
+    ) -> List[ExternalSignal]:
+        """Extract signals from a single transcript file"""
+        signals = []
         
-        for transcript_file in transcripts_dir.glob("*.txt"):
-            try:
-                # Check file date
-                file_time = datetime.fromtimestamp(transcript_file.stat().st_mtime)
-                if file_time < cutoff:
-                    continue
-                
-                content = transcript_file.read_text(encoding="utf-8", errors="ignore")
-                content_lower = content.lower()
-                
-                # Check if any search terms match
-                if not any(term.lower() in content_lower for term in search_terms):
-                    continue
-                
-                # Extract relevant sections
+        # Transcripts named after the project (e.g. 2024-07-15_acme_sync.txt)
+        # are relevant as a whole, so they skip the body probe entirely
+        name_match = matcher.search(transcript_file.name.lower()) is not None
+        relevance = 0.9 if name_match else 0.7
+        
+        try:
+            # Most transcripts don't mention the project - rule them out on
+            # the mapped bytes before decoding and lowercasing the text
+            if not name_match and probe is not None and not _file_contains(transcript_file, probe):
+                return signals
+            
+            content = transcript_file.read_text(encoding="utf-8", errors="ignore")
+            content_lower = content.lower()
+            
+            # Check if any search terms match
+            if matcher.search(content_lower):
                 relevant_sections = self._extract_relevant_sections(
-                    content, search_terms
+                    content, search_terms, content_lower, matcher
                 )
+            elif name_match:
+                relevant_sections = [content]
+            else:
+                return signals
+            
+            for section in relevant_sections:
+                signals.append(ExternalSignal(
+                    source="meeting_transcript",
+                    timestamp=datetime.fromtimestamp(mtime).isoformat(),
+                    content=section[:500],
+                    author=None,
+                    channel=transcript_file.stem,
+                    url=str(transcript_file),
+                    relevance_score=relevance,
+                    signal_type="context",
+                ))
                 
-                for section in relevant_sections:
-                    signals.append(ExternalSignal(
-                        source="meeting_transcript",
-                        timestamp=file_time.isoformat(),
-                        content=section[:500],
-                        author=None,
-                        channel=transcript_file.stem,
-                        url=str(transcript_file),
-                        relevance_score=0.7,
-                        signal_type="context",
-                    ))
-                    
-            except Exception as e:
-                print(f"Error reading transcript {transcript_file}: {e}")
+        except Exception as e:
+            print(f"Error reading transcript {transcript_file}: {e}")
         
         return signals
     
     def _extract_relevant_sections(
         self,
         content: str,
-        search_terms: List[str]
+        search_terms: List[str],
+        content_lower: Optional[str] = None,
+        matcher: Optional[Pattern] = None,
     ) -> List[str]:
-        """Extract sections of content that contain search terms"""
-        sections = []
-        lines = content.split("\n")
+        """
+        Extract sections of content that contain search terms.
         
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            if any(term.lower() in line_lower for term in search_terms):
-                # Get surrounding context
-                start = max(0, i - 2)
-                end = min(len(lines), i + 3)
-                section = "\n".join(lines[start:end])
-                sections.append(section)
+        Matching lines are found by Hyperscan when it is installed, otherwise
+        by one regex pass over the lowercased content; see _matching_lines.
+        """
+        sections = []
         
-        return sections[:5]  # Limit to 5 sections
+        # Windows are sliced straight out of content using line start
+        # offsets, rather than splitting into lines and re-joining them
+        line_starts = [0]
+        line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(content))
+        line_count = len(line_starts)
+        
+        for i in self._matching_lines(content, search_terms, content_lower, matcher):
+            # Get surrounding context (two lines either side)
+            start = line_starts[max(0, i - 2)]
+            end = i + 3
+            if end < line_count:
+                sections.append(content[start:line_starts[end] - 1])
+            else:
+                sections.append(content[start:])
+            if len(sections) >= 5:  # Limit to 5 sections
+                break
+        
+        return sections
+    
+    def _matching_lines(
+        self,
+        content: str,
+        search_terms: List[str],
+        content_lower: Optional[str] = None,
+        matcher: Optional[Pattern] = None,
+    ) -> Iterator[int]:
+        """Yield the indices of lines containing a search term, in order"""
+        if HAS_HYPERSCAN and search_terms and all(t.isascii() for t in search_terms):
+            try:
+                yield from _hyperscan_match_lines(content, tuple(search_terms))
+                return
+            except hyperscan.error as e:
+                print(f"Hyperscan scan failed, using regex matcher: {e}")
+        
+        if content_lower is None:
+            content_lower = content.lower()
+        if matcher is None:
+            matcher = _compile_terms(search_terms)
+        
+        # Lowercasing never adds or removes newlines, so line numbers found
+        # in content_lower index the same lines of content
+        line_starts = [0]
+        line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(content_lower))
+        
+        last_line = -1
+        for match in matcher.finditer(content_lower):
+            i = bisect_right(line_starts, match.start()) - 1
+            if i != last_line:
+                last_line = i
+                yield i
     
     def _synthesize(
         self,
@@ -306,8 +796,18 @@ class CrossSystemSynthesizer:
                 tribal_knowledge=[],
             )
         
-        # Extract stakeholders
-        stakeholders = list(set(
+        # Drop mirrored signals (e.g. the same Jira comment echoed in Slack)
+        seen = set()
+        unique_signals = []
+        for signal in signals:
+            key = hash(signal.content[:200])
+            if key not in seen:
+                seen.add(key)
+                unique_signals.append(signal)
+        signals = unique_signals
+        
+        # Extract stakeholders (deduped, first-seen order)
+        stakeholders = list(OrderedDict.fromkeys(
             s.author for s in signals if s.author
         ))
         
@@ -317,28 +817,34 @@ class CrossSystemSynthesizer:
         requirements = []
         tribal = []
         
-        decision_keywords = ["decided", "approved", "agreed", "go with", "chosen", "selected"]
-        concern_keywords = ["worried", "concern", "risk", "issue", "problem", "careful"]
-        requirement_keywords = ["must", "need to", "require", "should", "have to"]
-        tribal_keywords = ["always", "never", "we usually", "dave prefers", "the client wants"]
-        
         for signal in signals:
-            content_lower = signal.content.lower()
+            # One case-insensitive regex pass finds every keyword category,
+            # stopping early once all four have been seen
+            found = set()
+            for match in _SIGNAL_CLASS_RE.finditer(signal.content):
+                found.add(match.lastgroup)
+                if len(found) == 4:
+                    break
+            if not found:
+                continue
             
-            if any(kw in content_lower for kw in decision_keywords):
-                decisions.append(signal.content[:100])
+            # Buckets are not exclusive, so share one truncated snippet
+            snippet = signal.content[:100]
+            
+            if "dec" in found:
+                decisions.append(snippet)
                 signal.signal_type = "decision"
             
-            if any(kw in content_lower for kw in concern_keywords):
-                concerns.append(signal.content[:100])
+            if "con" in found:
+                concerns.append(snippet)
                 signal.signal_type = "concern"
             
-            if any(kw in content_lower for kw in requirement_keywords):
-                requirements.append(signal.content[:100])
+            if "req" in found:
+                requirements.append(snippet)
                 signal.signal_type = "requirement"
             
-            if any(kw in content_lower for kw in tribal_keywords):
-                tribal.append(signal.content[:100])
+            if "tri" in found:
+                tribal.append(snippet)
                 signal.signal_type = "tribal_knowledge"
         
         # Build summary
@@ -364,39 +870,36 @@ class CrossSystemSynthesizer:
         """Format synthesized context for inclusion in agent prompt"""
         if not context.signals:
             return ""
-        
-        lines = ["## Cross-System Context\n"]
-        lines.append(context.summary)
-        lines.append("")
+        return "\n".join(self._iter_format(context))
+    
+    def _iter_format(self, context: SynthesizedContext) -> Iterator[str]:
+        """Yield the lines of format_for_agent, skipping empty sections"""
+        yield "## Cross-System Context\n"
+        yield context.summary
+        yield ""
         
         if context.decisions_mentioned:
-            lines.append("### Decisions Already Made")
-            for d in context.decisions_mentioned:
-                lines.append(f"- {d}")
-            lines.append("")
+            yield "### Decisions Already Made"
+            yield from (f"- {d}" for d in context.decisions_mentioned)
+            yield ""
         
         if context.concerns_raised:
-            lines.append("### Concerns Raised")
-            for c in context.concerns_raised:
-                lines.append(f"- ⚠️ {c}")
-            lines.append("")
+            yield "### Concerns Raised"
+            yield from (f"- ⚠️ {c}" for c in context.concerns_raised)
+            yield ""
         
         if context.requirements_implied:
-            lines.append("### Implied Requirements")
-            for r in context.requirements_implied:
-                lines.append(f"- {r}")
-            lines.append("")
+            yield "### Implied Requirements"
+            yield from (f"- {r}" for r in context.requirements_implied)
+            yield ""
         
         if context.tribal_knowledge:
-            lines.append("### Tribal Knowledge")
-            for t in context.tribal_knowledge:
-                lines.append(f"- 💡 {t}")
-            lines.append("")
+            yield "### Tribal Knowledge"
+            yield from (f"- 💡 {t}" for t in context.tribal_knowledge)
+            yield ""
         
         if context.key_stakeholders:
-            lines.append(f"**Key Stakeholders:** {', '.join(context.key_stakeholders)}")
-        
-        return "\n".join(lines)
+            yield f"**Key Stakeholders:** {', '.join(context.key_stakeholders)}"
 
 
 # Synchronous version for simpler use cases
@@ -434,59 +937,67 @@ class SimpleSynthesizer:
         self,
         project_dir: Path,
         feature_name: Optional[str]
-    ) -> List[ExternalSignal]:
-        """Scan project notes for relevant context"""
-        signals = []
-        
-        for note_file in project_dir.glob("**/*.md"):
-            try:
-                content = note_file.read_text(encoding="utf-8")
-                
-                # Always include, these are project-specific
-                signals.append(ExternalSignal(
-                    source="project_notes",
-                    timestamp=datetime.fromtimestamp(note_file.stat().st_mtime).isoformat(),
-                    content=content[:500],
-                    author=None,
-                    channel=note_file.stem,
-                    url=str(note_file),
-                    relevance_score=0.9,
-                    signal_type="context",
-                ))
-            except:
-                pass
-        
-        return signals
+    ) -> Iterator[ExternalSignal]:
+        """Scan project notes for relevant context, yielding signals as read"""
+        note_files = _scan_files(project_dir, ".md", recursive=True)
+        
+        # Reads are pure filesystem waits, so threads overlap them well
+        with ThreadPoolExecutor(max_workers=NOTE_READ_WORKERS) as executor:
+            results = executor.map(lambda item: self._read_note_to_signal(*item), note_files)
+            yield from (signal for signal in results if signal is not None)
+    
+    def _read_note_to_signal(self, note_file: Path, mtime: float) -> Optional[ExternalSignal]:
+        """Read one project note into a signal (None if unreadable)"""
+        try:
+            content = note_file.read_text(encoding="utf-8")
+            
+            # Always include, these are project-specific
+            return ExternalSignal(
+                source="project_notes",
+                timestamp=datetime.fromtimestamp(mtime).isoformat(),
+                content=content[:500],
+                author=None,
+                channel=note_file.stem,
+                url=str(note_file),
+                relevance_score=0.9,
+                signal_type="context",
+            )
+        except:
+            return None
     
     def _scan_transcripts(
         self,
         project_id: str,
         feature_name: Optional[str]
-    ) -> List[ExternalSignal]:
-        """Scan meeting transcripts"""
-        signals = []
+    ) -> Iterator[ExternalSignal]:
+        """Scan meeting transcripts, yielding a signal per matching file"""
         search_terms = [project_id]
         if feature_name:
             search_terms.append(feature_name)
         
-        for transcript in self.transcripts_dir.glob("*.txt"):
+        # All lowercased terms in one compiled alternation; each file's
+        # content is lowercased once and searched in a single pass
+        matcher = _compile_terms(search_terms)
+        
+        for transcript, mtime in _scan_files(self.transcripts_dir, ".txt"):
             try:
                 content = transcript.read_text(encoding="utf-8", errors="ignore")
-                if any(term.lower() in content.lower() for term in search_terms):
-                    signals.append(ExternalSignal(
-                        source="transcript",
-                        timestamp=datetime.fromtimestamp(transcript.stat().st_mtime).isoformat(),
-                        content=content[:500],
-                        author=None,
-                        channel=transcript.stem,
-                        url=str(transcript),
-                        relevance_score=0.7,
-                        signal_type="context",
-                    ))
+                if not matcher.search(content.lower()):
+                    continue
             except:
-                pass
-        
-        return signals
+                continue
+            
+            # Only the kept prefix outlives this iteration
+            yield ExternalSignal(
+                source="transcript",
+                timestamp=datetime.fromtimestamp(mtime).isoformat(),
+                content=content[:500],
+                author=None,
+                channel=transcript.stem,
+                url=str(transcript),
+                relevance_score=0.7,
+                signal_type="context",
+            )
     
     def _synthesize(
         self,
@@ -9,13 +9,105 @@ Based on research showing that:
 """
 
 import ast
+import hashlib
+import json
+import multiprocessing
+import os
 import re
+import sqlite3
+import sys
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Generator
 import anthropic
 
-from core.knowledge_base import KnowledgeBase
+from core.knowledge_base import KnowledgeBase, MANIFEST_NAME
+
+
+# Message Batches limits and polling for bulk description generation
+BATCH_MAX_REQUESTS = 10_000
+# Below this the threaded per-node calls finish in seconds, sooner than a
+# batch is usually picked up
+BATCH_MIN_NODES = 500
+# Status polls back off from the first interval to the max
+BATCH_POLL_INTERVAL = 5.0
+BATCH_POLL_MAX_INTERVAL = 60.0
+# Batches may take up to 24h; past this many seconds a batch is cancelled,
+# its finished results kept and the rest described per node instead
+BATCH_MAX_WAIT = 15 * 60
+
+# Parsing is CPU-bound and goes to processes; description calls are
+# network-bound and go to threads. The process pool is only used where it
+# can fork with no other threads alive; spawned workers (Windows, macOS)
+# would re-import core and its heavy dependencies, and forking next to the
+# context graph writer or Chroma's threads can deadlock. Otherwise, and for
+# tiny trees, parsing runs in threads.
+PARSE_WORKERS = min(8, os.cpu_count() or 1)
+PARSE_POOL_MIN_FILES = 4
+DESCRIBE_WORKERS = 16
+
+_NEWLINE_RE = re.compile("\n")
+
+# Documents buffered before one bulk knowledge base write
+KB_WRITE_BATCH_SIZE = 64
+
+# Indexing skips blobs that would only bloat the knowledge base: large
+# files, minified bundles (very long lines) and binaries (NUL bytes)
+WHOLE_FILE_MAX_BYTES = 512_000
+WHOLE_FILE_MAX_AVG_LINE = 400
+BINARY_PROBE_BYTES = 4096
+
+
+
+def _skip_reason(path: str, size: int) -> str | None:
+    """Why a file is too large, binary or minified to index, or None"""
+    if size > WHOLE_FILE_MAX_BYTES:
+        return f"larger than {WHOLE_FILE_MAX_BYTES} bytes"
+    with open(path, "rb") as f:
+        data = f.read()
+    if b"\0" in data[:BINARY_PROBE_BYTES]:
+        return "binary"
+    if len(data) / (data.count(b"\n") + 1) > WHOLE_FILE_MAX_AVG_LINE:
+        return "minified"
+    return None
+
+
+def _line_offsets(content: str) -> list[int]:
+    """Start offset of every line in content"""
+    offsets = [0]
+    offsets.extend(m.end() for m in _NEWLINE_RE.finditer(content))
+    return offsets
+
+
+def _slice_lines(content: str, offsets: list[int], start: int, end: int) -> str:
+    """Lines start..end-1 (0-based) of content, without the final newline"""
+    if end < len(offsets):
+        return content[offsets[start]:offsets[end] - 1]
+    return content[offsets[start]:]
+
+
+# Constant types whose repr() is what ast.unparse would print. Others
+# differ (Ellipsis -> "...", float inf -> "1e309") and go to ast.unparse
+_REPR_CONSTANTS = (str, int, bool, type(None))
+
+
+def _format_annotation(node: ast.expr) -> str:
+    """
+    Render an annotation as source text, skipping the full ast.unparse
+    visitor for the common cases: a bare name like str or a class, or a
+    plain string/int/None constant
+    """
+    if type(node) is ast.Name:
+        return node.id
+    if type(node) is ast.Constant and type(node.value) in _REPR_CONSTANTS:
+        return repr(node.value)
+    return ast.unparse(node)
 
 
 @dataclass
@@ -35,71 +127,31 @@ class CodeNode:
 class PythonParser:
     """Parse Python files into code nodes"""
     
-    def parse_file(self, file_path: str) -> list[CodeNode]:
-        """Parse a Python file into code nodes"""
+    def parse_file(self, file_path: str, content: str | None = None) -> list[CodeNode]:
+        """Parse a Python file into code nodes, reading it unless content is given"""
         path = Path(file_path)
-        if not path.exists() or path.suffix != ".py":
+        if path.suffix != ".py":
             return []
         
-        content = path.read_text(encoding="utf-8")
+        if content is None:
+            if not path.exists():
+                return []
+            content = path.read_text(encoding="utf-8")
         
         try:
             tree = ast.parse(content)
         except SyntaxError:
             return []
         
-        nodes = []
-        lines = content.split("\n")
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-                # Check if it's a method (inside a class)
-                parent = self._find_parent_class(tree, node)
-                
-                code = self._extract_code(lines, node.lineno - 1, node.end_lineno)
-                signature = self._extract_signature(node)
-                
-                nodes.append(CodeNode(
-                    name=node.name,
-                    node_type="method" if parent else "function",
-                    code=code,
-                    file_path=str(path),
-                    line_start=node.lineno,
-                    line_end=node.end_lineno or node.lineno,
-                    docstring=ast.get_docstring(node),
-                    parent=parent,
-                    signature=signature
-                ))
-            
-            elif isinstance(node, ast.ClassDef):
-                code = self._extract_code(lines, node.lineno - 1, node.end_lineno)
-                
-                nodes.append(CodeNode(
-                    name=node.name,
-                    node_type="class",
-                    code=code,
-                    file_path=str(path),
-                    line_start=node.lineno,
-                    line_end=node.end_lineno or node.lineno,
-                    docstring=ast.get_docstring(node)
-                ))
-        
-        return nodes
-    
-    def _find_parent_class(self, tree: ast.AST, target: ast.AST) -> str | None:
-        """Find if a function is inside a class"""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                for child in ast.iter_child_nodes(node):
-                    if child is target:
-                        return node.name
-        return None
+        collector = _PythonNodeCollector(self, content, _line_offsets(content), str(path))
+        collector.visit(tree)
+        return collector.nodes
     
-    def _extract_code(self, lines: list[str], start: int, end: int | None) -> str:
+    def _extract_code(self, content: str, offsets: list[int], start: int, end: int | None) -> str:
         """Extract code lines"""
         if end is None:
             end = start + 1
-        return "\n".join(lines[start:end])
+        return _slice_lines(content, offsets, start, end)
     
     def _extract_signature(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
         """Extract function signature"""
@@ -107,86 +159,121 @@ class PythonParser:
         for arg in node.args.args:
             arg_str = arg.arg
             if arg.annotation:
-                arg_str += f": {ast.unparse(arg.annotation)}"
+                arg_str += f": {_format_annotation(arg.annotation)}"
             args.append(arg_str)
         
         returns = ""
         if node.returns:
-            returns = f" -> {ast.unparse(node.returns)}"
+            returns = f" -> {_format_annotation(node.returns)}"
         
         prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
         return f"{prefix} {node.name}({', '.join(args)}){returns}"
 
 
+class _PythonNodeCollector(ast.NodeVisitor):
+    """
+    Collect functions, methods and classes in one pass over the tree.
+    A function is a method only when it sits directly in a class body.
+    """
+    
+    def __init__(self, parser: PythonParser, content: str, offsets: list[int], file_path: str):
+        self.parser = parser
+        self.content = content
+        self.offsets = offsets
+        self.file_path = file_path
+        self.nodes: list[CodeNode] = []
+    
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.nodes.append(CodeNode(
+            name=node.name,
+            node_type="class",
+            code=self.parser._extract_code(self.content, self.offsets, node.lineno - 1, node.end_lineno),
+            file_path=self.file_path,
+            line_start=node.lineno,
+            line_end=node.end_lineno or node.lineno,
+            docstring=ast.get_docstring(node)
+        ))
+        
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self._add_function(child, parent=node.name)
+            else:
+                self.visit(child)
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef):
+        self._add_function(node, parent=None)
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def _add_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef, parent: str | None):
+        self.nodes.append(CodeNode(
+            name=node.name,
+            node_type="method" if parent else "function",
+            code=self.parser._extract_code(self.content, self.offsets, node.lineno - 1, node.end_lineno),
+            file_path=self.file_path,
+            line_start=node.lineno,
+            line_end=node.end_lineno or node.lineno,
+            docstring=ast.get_docstring(node),
+            parent=parent,
+            signature=self.parser._extract_signature(node)
+        ))
+        
+        # Nested functions and classes are indexed too
+        self.generic_visit(node)
+
+
 class TypeScriptParser:
     """Parse TypeScript/JavaScript files into code nodes using regex (simplified)"""
     
-    # Patterns for TS/JS parsing
-    FUNCTION_PATTERN = re.compile(
-        r'^(?:export\s+)?(?:async\s+)?function\s+(\w+)\s*\([^)]*\)[^{]*\{',
+    # One pattern for TS/JS parsing; the named group that matched gives the
+    # kind. It is a zero-width lookahead at each line start so a long match
+    # never swallows a declaration that starts inside it.
+    NODE_PATTERN = re.compile(
+        r'^(?=(?:export\s+)?(?:'
+        r'(?:async\s+)?function\s+(?P<function>\w+)\s*\([^)]*\)[^{]*\{'
+        r'|(?:const|let)\s+(?P<arrow>\w+)\s*=\s*(?:async\s+)?\([^)]*\)\s*(?::\s*[^=]+)?\s*=>'
+        r'|(?:abstract\s+)?class\s+(?P<class>\w+)'
+        r'))',
         re.MULTILINE
     )
     
-    ARROW_FUNCTION_PATTERN = re.compile(
-        r'^(?:export\s+)?(?:const|let)\s+(\w+)\s*=\s*(?:async\s+)?\([^)]*\)\s*(?::\s*[^=]+)?\s*=>',
-        re.MULTILINE
+    # Braces plus the strings and comments whose braces must not count.
+    # Quoted strings stop at a newline so a stray apostrophe in JSX text
+    # cannot swallow the rest of the file.
+    BLOCK_TOKEN_PATTERN = re.compile(
+        r'"(?:\\.|[^"\\\n])*"'
+        r"|'(?:\\.|[^'\\\n])*'"
+        r'|`(?:\\.|[^`\\])*`'
+        r'|//[^\n]*'
+        r'|/\*.*?\*/'
+        r'|[{}]',
+        re.DOTALL
     )
     
-    CLASS_PATTERN = re.compile(
-        r'^(?:export\s+)?(?:abstract\s+)?class\s+(\w+)',
-        re.MULTILINE
-    )
-    
-    def parse_file(self, file_path: str) -> list[CodeNode]:
-        """Parse a TypeScript/JavaScript file into code nodes"""
+    def parse_file(self, file_path: str, content: str | None = None) -> list[CodeNode]:
+        """Parse a TypeScript/JavaScript file into code nodes, reading it unless content is given"""
         path = Path(file_path)
-        if not path.exists() or path.suffix not in (".ts", ".tsx", ".js", ".jsx"):
+        if path.suffix not in (".ts", ".tsx", ".js", ".jsx"):
             return []
         
-        content = path.read_text(encoding="utf-8")
-        lines = content.split("\n")
+        if content is None:
+            if not path.exists():
+                return []
+            content = path.read_text(encoding="utf-8")
+        offsets = _line_offsets(content)
+        opens, brace_match = self._match_braces(content)
         nodes = []
         
-        # Find functions
-        for match in self.FUNCTION_PATTERN.finditer(content):
-            name = match.group(1)
-            start_line = content[:match.start()].count("\n") + 1
-            end_line = self._find_block_end(lines, start_line - 1)
+        for match in self.NODE_PATTERN.finditer(content):
+            kind = match.lastgroup
+            name = match.group(kind)
+            start_line = bisect_right(offsets, match.start())
+            end_line = self._find_block_end(offsets, opens, brace_match, start_line - 1)
             
             nodes.append(CodeNode(
                 name=name,
-                node_type="function",
-                code=self._extract_code(lines, start_line - 1, end_line),
-                file_path=str(path),
-                line_start=start_line,
-                line_end=end_line
-            ))
-        
-        # Find arrow functions
-        for match in self.ARROW_FUNCTION_PATTERN.finditer(content):
-            name = match.group(1)
-            start_line = content[:match.start()].count("\n") + 1
-            end_line = self._find_block_end(lines, start_line - 1)
-            
-            nodes.append(CodeNode(
-                name=name,
-                node_type="function",
-                code=self._extract_code(lines, start_line - 1, end_line),
-                file_path=str(path),
-                line_start=start_line,
-                line_end=end_line
-            ))
-        
-        # Find classes
-        for match in self.CLASS_PATTERN.finditer(content):
-            name = match.group(1)
-            start_line = content[:match.start()].count("\n") + 1
-            end_line = self._find_block_end(lines, start_line - 1)
-            
-            nodes.append(CodeNode(
-                name=name,
-                node_type="class",
-                code=self._extract_code(lines, start_line - 1, end_line),
+                node_type="class" if kind == "class" else "function",
+                code=self._extract_code(content, offsets, start_line - 1, end_line),
                 file_path=str(path),
                 line_start=start_line,
                 line_end=end_line
@@ -194,35 +281,140 @@ class TypeScriptParser:
         
         return nodes
     
-    def _find_block_end(self, lines: list[str], start: int) -> int:
-        """Find end of a code block by counting braces"""
-        brace_count = 0
-        started = False
-        
-        for i in range(start, len(lines)):
-            line = lines[i]
-            for char in line:
-                if char == "{":
-                    brace_count += 1
-                    started = True
-                elif char == "}":
-                    brace_count -= 1
-            
-            if started and brace_count == 0:
-                return i + 1
-        
-        return len(lines)
+    def _match_braces(self, content: str) -> tuple[list[int], dict[int, int]]:
+        """
+        Pair every brace in the file in one pass, skipping strings and
+        comments. Returns the sorted open-brace offsets and a map from each
+        open brace to its matching close brace.
+        """
+        opens = []
+        brace_match = {}
+        stack = []
+        
+        # Declaration-only files (e.g. type re-exports) have nothing to pair
+        if "{" not in content:
+            return opens, brace_match
+        
+        for token in self.BLOCK_TOKEN_PATTERN.finditer(content):
+            char = token.group()
+            if char == "{":
+                opens.append(token.start())
+                stack.append(token.start())
+            elif char == "}" and stack:
+                brace_match[stack.pop()] = token.start()
+        
+        return opens, brace_match
+    
+    def _find_block_end(
+        self,
+        offsets: list[int],
+        opens: list[int],
+        brace_match: dict[int, int],
+        start: int
+    ) -> int:
+        """Find end line of the block whose first brace follows line start"""
+        i = bisect_left(opens, offsets[start])
+        if i == len(opens) or opens[i] not in brace_match:
+            return len(offsets)
+        return bisect_right(offsets, brace_match[opens[i]])
     
-    def _extract_code(self, lines: list[str], start: int, end: int) -> str:
+    def _extract_code(self, content: str, offsets: list[int], start: int, end: int) -> str:
         """Extract code lines"""
-        return "\n".join(lines[start:end])
+        return _slice_lines(content, offsets, start, end)
+
+
+class DescriptionCache:
+    """Persistent content-addressed store of generated descriptions"""
+    
+    DEFAULT_PATH = Path.home() / ".ai-dev-workflow" / "description_cache.db"
+    
+    def __init__(self, path: Path | None = None):
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS descriptions ("
+            "hash TEXT PRIMARY KEY, description TEXT, model TEXT, created_at TEXT)"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def key(node: CodeNode) -> str:
+        """Hash of what the model sees, so renamed or duplicated code still hits"""
+        return hashlib.sha256(
+            (node.node_type + "\0" + node.code[:2000]).encode("utf-8")
+        ).hexdigest()
+    
+    def get(self, key: str, model: str) -> str | None:
+        """Return a cached description, or None on a miss"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT description FROM descriptions WHERE hash = ? AND model = ?",
+                (key, model)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def put(self, key: str, model: str, description: str):
+        """Store a generated description"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?, ?)",
+                (key, description, model, datetime.now().isoformat())
+            )
+            self._conn.commit()
+    
+    def put_many(self, model: str, descriptions: dict[str, str]):
+        """Store a batch of generated descriptions in one transaction"""
+        created_at = datetime.now().isoformat()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?, ?)",
+                [(key, text, model, created_at) for key, text in descriptions.items()]
+            )
+            self._conn.commit()
 
 
 class DescriptionGenerator:
     """Generate natural language descriptions for code using Claude"""
     
-    def __init__(self, client: anthropic.Anthropic | None = None):
-        self.client = client or anthropic.Anthropic()
+    MODEL = "claude-sonnet-4-5-20250929"
+    
+    # Fixed instructions, kept out of the per-node user message. Too short
+    # for prompt caching (Sonnet only caches prefixes of 1024+ tokens), so
+    # no cache_control marker
+    SYSTEM = [{
+        "type": "text",
+        "text": (
+            "Describe what the given function, method or class does in 1-2 "
+            "sentences. Be specific about its purpose and behavior.\n\n"
+            "Respond with only the description, no preamble."
+        ),
+    }]
+    
+    # Per-node user message and the request parameters shared by every call
+    PROMPT_TEMPLATE = "{node_type}:\n```\n{code}\n```"
+    REQUEST_PARAMS = {
+        "model": MODEL,
+        "max_tokens": 200,
+        "temperature": 0,
+        "system": SYSTEM,
+    }
+    
+    def __init__(
+        self,
+        client: anthropic.Anthropic | None = None,
+        cache: DescriptionCache | None = None
+    ):
+        self._client = client
+        self.cache = cache or DescriptionCache()
+    
+    @property
+    def client(self) -> anthropic.Anthropic:
+        """API client, created on first use so offline runs need no API key"""
+        if self._client is None:
+            self._client = anthropic.Anthropic()
+        return self._client
     
     def generate(self, node: CodeNode) -> str:
         """Generate a description for a code node"""
@@ -231,26 +423,147 @@ class DescriptionGenerator:
         if node.docstring:
             return node.docstring
         
-        # Generate using Claude
-        prompt = f"""Describe what this {node.node_type} does in 1-2 sentences. Be specific about its purpose and behavior.
-
-```
-{node.code[:2000]}
-```
-
-Respond with only the description, no preamble."""
-
+        # Identical code was described before (re-index, copied helpers)
+        cache_key = DescriptionCache.key(node)
+        cached = self.cache.get(cache_key, self.MODEL)
+        if cached is not None:
+            return cached
+        
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=200,
-                temperature=0,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return response.content[0].text.strip()
+            response = self.client.messages.create(**self._request_params(node))
+            description = response.content[0].text.strip()
         except Exception as e:
-            # Fallback to basic description
+            # Fallback to basic description (not cached, so it is retried)
             return f"A {node.node_type} named {node.name}"
+        
+        self.cache.put(cache_key, self.MODEL, description)
+        return description
+    
+    def generate_batch(self, nodes: list[CodeNode]) -> int:
+        """
+        Describe every uncached node through the Message Batches API and
+        store the results in the cache, so the following generate() calls
+        are all hits. A batch still running after BATCH_MAX_WAIT seconds is
+        cancelled; whatever it finished is kept and the rest is left to
+        generate(). Returns the number of descriptions stored.
+        """
+        pending = {}
+        for node in nodes:
+            if node.docstring:
+                continue
+            cache_key = DescriptionCache.key(node)
+            if cache_key not in pending and self.cache.get(cache_key, self.MODEL) is None:
+                pending[cache_key] = node
+        
+        if len(pending) < BATCH_MIN_NODES:
+            return 0
+        
+        requests = [
+            {"custom_id": cache_key, "params": self._request_params(node)}
+            for cache_key, node in pending.items()
+        ]
+        
+        stored = 0
+        for i in range(0, len(requests), BATCH_MAX_REQUESTS):
+            chunk = requests[i:i + BATCH_MAX_REQUESTS]
+            print(f"  Describing {len(chunk)} nodes via the Message Batches API...")
+            batch = self.client.messages.batches.create(requests=chunk)
+            self._wait_for_batch(batch)
+            
+            # Failed or expired requests are left uncached for generate() to retry
+            descriptions = {}
+            for entry in self.client.messages.batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    descriptions[entry.custom_id] = entry.result.message.content[0].text.strip()
+            
+            self.cache.put_many(self.MODEL, descriptions)
+            stored += len(descriptions)
+        
+        return stored
+    
+    def _wait_for_batch(self, batch):
+        """
+        Poll a batch until it has ended, backing off between polls. Past
+        BATCH_MAX_WAIT it is cancelled, and polled until the cancellation
+        ends so its finished results can still be read.
+        """
+        deadline = time.monotonic() + BATCH_MAX_WAIT
+        interval = BATCH_POLL_INTERVAL
+        cancelled = False
+        while batch.processing_status != "ended":
+            if not cancelled and time.monotonic() >= deadline:
+                print(f"  Batch {batch.id} still running after {BATCH_MAX_WAIT}s, cancelling")
+                self.client.messages.batches.cancel(batch.id)
+                cancelled = True
+            time.sleep(interval)
+            interval = min(interval * 2, BATCH_POLL_MAX_INTERVAL)
+            batch = self.client.messages.batches.retrieve(batch.id)
+    
+    def _request_params(self, node: CodeNode) -> dict:
+        """Build messages.create parameters - only the code varies between calls"""
+        prompt = self.PROMPT_TEMPLATE.format(node_type=node.node_type, code=node.code[:2000])
+        return {**self.REQUEST_PARAMS, "messages": [{"role": "user", "content": prompt}]}
+
+
+def _walk_files(
+    root: str,
+    exclude_dirs: set[str],
+    extensions: frozenset[str]
+) -> Generator[os.DirEntry, None, None]:
+    """
+    Yield files under root with a wanted extension. Excluded directories
+    are pruned without being entered, and directory symlinks are not
+    followed.
+    """
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in exclude_dirs:
+                yield from _walk_files(entry.path, exclude_dirs, extensions)
+        elif os.path.splitext(entry.name)[1] in extensions and entry.is_file():
+            yield entry
+
+
+def _parse_with(
+    python_parser: PythonParser,
+    ts_parser: TypeScriptParser,
+    file_path: str
+) -> list[CodeNode] | None:
+    """Parse a file into code nodes, or None if it has no parser"""
+    path = Path(file_path)
+    
+    if path.suffix == ".py":
+        parser = python_parser
+    elif path.suffix in (".ts", ".tsx", ".js", ".jsx"):
+        parser = ts_parser
+    else:
+        return None
+    
+    # Read here and hand the text over, so the parser skips its own
+    # existence check and read
+    try:
+        content = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return []
+    return parser.parse_file(file_path, content)
+
+
+def _can_fork_safely() -> bool:
+    """
+    True when a fork-based process pool is safe: the platform forks cleanly
+    (not Windows or macOS), the host has not chosen another start method,
+    and this is the only thread. The start method is read with allow_none
+    so the host can still set it later.
+    """
+    if sys.platform == "darwin" or "fork" not in multiprocessing.get_all_start_methods():
+        return False
+    if multiprocessing.get_start_method(allow_none=True) not in (None, "fork"):
+        return False
+    return threading.active_count() == 1
 
 
 class EnhancedCodeIndexer:
@@ -265,26 +578,48 @@ class EnhancedCodeIndexer:
         self.generate_descriptions = generate_descriptions
         self.python_parser = PythonParser()
         self.ts_parser = TypeScriptParser()
-        
-        if generate_descriptions:
-            self.description_generator = DescriptionGenerator()
-        else:
-            self.description_generator = None
+        self._description_generator = None
+        self._pending: list[dict] = []
+        self.skipped: list[str] = []
+    
+    @property
+    def description_generator(self) -> DescriptionGenerator | None:
+        """Description generator, built on first use when descriptions are enabled"""
+        if self._description_generator is None and self.generate_descriptions:
+            self._description_generator = DescriptionGenerator()
+        return self._description_generator
+    
+    @description_generator.setter
+    def description_generator(self, generator: DescriptionGenerator | None):
+        self._description_generator = generator
     
     def index_file(self, file_path: str) -> int:
         """Index a single file, returns number of nodes indexed"""
-        path = Path(file_path)
-        
-        if path.suffix == ".py":
-            nodes = self.python_parser.parse_file(file_path)
-        elif path.suffix in (".ts", ".tsx", ".js", ".jsx"):
-            nodes = self.ts_parser.parse_file(file_path)
-        else:
+        try:
+            count = self._index_parsed(file_path, self._parse_file(file_path))
+        except Exception:
+            self._pending.clear()
+            raise
+        self._flush_pending()
+        return count
+    
+    def _parse_file(self, file_path: str) -> list[CodeNode] | None:
+        """Parse a file into code nodes, or None if it has no parser"""
+        return _parse_with(self.python_parser, self.ts_parser, file_path)
+    
+    def _index_parsed(
+        self,
+        file_path: str,
+        nodes: list[CodeNode] | None,
+        descriptions: list[str] | None = None
+    ) -> int:
+        """Index the nodes parsed from a file"""
+        if nodes is None:
             # For other files, index as whole file
             return self._index_whole_file(file_path)
         
-        for node in nodes:
-            self._index_node(node)
+        for i, node in enumerate(nodes):
+            self._index_node(node, descriptions[i] if descriptions else None)
         
         return len(nodes)
     
@@ -292,47 +627,224 @@ class EnhancedCodeIndexer:
         self,
         directory: str,
         extensions: list[str] | None = None,
-        exclude_dirs: list[str] | None = None
+        exclude_dirs: list[str] | None = None,
+        force: bool = False
     ) -> dict:
-        """Index all code files in a directory"""
+        """
+        Index all code files in a directory.
+        
+        Files whose mtime and size match the last run's manifest are skipped
+        while the knowledge base still holds documents for them; force=True
+        re-indexes everything.
+        """
         
-        extensions = extensions or [".py", ".ts", ".tsx", ".js", ".jsx"]
-        exclude_dirs = exclude_dirs or ["node_modules", ".git", "__pycache__", "venv", ".venv", "dist", "build"]
+        extensions = frozenset(extensions or [".py", ".ts", ".tsx", ".js", ".jsx"])
+        exclude_dirs = set(exclude_dirs or ["node_modules", ".git", "__pycache__", "venv", ".venv", "dist", "build"])
         
+        self.skipped = []
         stats = {
             "files_processed": 0,
+            "files_unchanged": 0,
             "nodes_indexed": 0,
-            "errors": []
+            "errors": [],
+            "skipped": self.skipped
         }
         
         dir_path = Path(directory)
-        
-        for file_path in dir_path.rglob("*"):
-            # Skip excluded directories
-            if any(excl in file_path.parts for excl in exclude_dirs):
+        manifest_path = Path(self.kb.persist_directory) / MANIFEST_NAME
+        manifest_key = str(dir_path.resolve())
+        previous = self._load_manifest(manifest_path, manifest_key)
+        # Manifest entries only count while their documents are still in the
+        # store (it may have been cleared or rebuilt since the last run)
+        indexed = self.kb.indexed_file_paths() if previous and not force else set()
+        manifest = {}
+        
+        file_paths = []
+        for entry in _walk_files(str(dir_path), exclude_dirs, extensions):
+            st = entry.stat()
+            signature = [st.st_mtime_ns, st.st_size]
+            # Same form the parsers store as file_path ("./src/a.py" ->
+            # "src/a.py"), so deletes match the indexed documents
+            key = str(Path(entry.path))
+            
+            if previous.get(key) == signature and key in indexed:
+                manifest[key] = signature
+                stats["files_unchanged"] += 1
                 continue
             
-            if file_path.is_file() and file_path.suffix in extensions:
+            if key in previous:
+                # Changed since the last run - drop its stale nodes
+                self.kb.delete_file_documents(key)
+            
+            # Bundles and blobs (dist/app.min.js) would otherwise be parsed
+            # and described node by node
+            try:
+                reason = _skip_reason(entry.path, st.st_size)
+            except OSError as e:
+                stats["errors"].append(f"{key}: {e}")
+                continue
+            if reason:
+                self.skipped.append(f"{key}: {reason}")
+                continue
+            
+            file_paths.append(key)
+            manifest[key] = signature
+        
+        # Files deleted since the last run
+        for key in previous.keys() - manifest.keys():
+            self.kb.delete_file_documents(key)
+        
+        # Phase 1: parse everything up front
+        parsed = self._parse_files(file_paths, stats["errors"])
+        
+        # Only files that index cleanly are recorded; the rest are retried
+        parsed_paths = {file_path for file_path, _ in parsed}
+        for file_path in file_paths:
+            if file_path not in parsed_paths:
+                del manifest[file_path]
+        all_nodes = [node for _, nodes in parsed if nodes for node in nodes]
+        
+        describing = self.generate_descriptions and self.description_generator
+        
+        # Phase 2: describe all uncached nodes in one batch; anything the
+        # batch misses falls back to a per-node call below
+        if describing:
+            try:
+                self.description_generator.generate_batch(all_nodes)
+            except Exception as e:
+                stats["errors"].append(f"Batch description generation: {e}")
+        
+        # Phase 3: index. Descriptions are produced in node order by the
+        # thread pool and consumed while earlier files are being indexed.
+        # Documents are written to the knowledge base in bulk; a file only
+        # counts as processed once the write holding its documents succeeds
+        pool = ThreadPoolExecutor(max_workers=DESCRIBE_WORKERS) if describing else None
+        buffered_files = []
+        try:
+            descriptions = (pool.map if pool else map)(self._describe, all_nodes)
+            
+            for file_path, nodes in parsed:
+                # Take this file's descriptions before indexing so a failure
+                # part-way through cannot shift later files out of step
+                file_descriptions = [next(descriptions) for _ in nodes or ()]
+                mark = len(self._pending)
                 try:
-                    count = self.index_file(str(file_path))
-                    stats["files_processed"] += 1
-                    stats["nodes_indexed"] += count
+                    count = self._index_parsed(file_path, nodes, file_descriptions)
+                    buffered_files.append((file_path, count))
                 except Exception as e:
+                    del self._pending[mark:]
                     stats["errors"].append(f"{file_path}: {e}")
+                    del manifest[file_path]
+                
+                if len(self._pending) >= KB_WRITE_BATCH_SIZE:
+                    self._flush_files(buffered_files, stats, manifest)
+            
+            self._flush_files(buffered_files, stats, manifest)
+        finally:
+            self._pending.clear()
+            if pool:
+                pool.shutdown()
+        
+        self._save_manifest(manifest_path, manifest_key, manifest)
         
         return stats
     
-    def _index_node(self, node: CodeNode):
-        """Index a single code node with description"""
+    def _flush_files(self, buffered_files: list[tuple[str, int]], stats: dict, manifest: dict):
+        """Write buffered documents and credit (or fail) the files they came from"""
+        try:
+            self._flush_pending()
+        except Exception as e:
+            for file_path, _ in buffered_files:
+                stats["errors"].append(f"{file_path}: {e}")
+                del manifest[file_path]
+        else:
+            for _, count in buffered_files:
+                stats["files_processed"] += 1
+                stats["nodes_indexed"] += count
+        buffered_files.clear()
+    
+    def _flush_pending(self):
+        """Write buffered documents to the knowledge base in one call"""
+        if self._pending:
+            documents, self._pending = self._pending, []
+            self.kb.add_documents(documents)
+    
+    def _load_manifest(self, manifest_path: Path, directory: str) -> dict:
+        """Load {file_path: [mtime_ns, size]} indexed from directory into this knowledge base"""
+        if not manifest_path.exists():
+            return {}
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                return json.load(f).get(self.kb.project_id, {}).get(directory, {})
+        except (json.JSONDecodeError, OSError, AttributeError):
+            return {}
+    
+    def _save_manifest(self, manifest_path: Path, directory: str, manifest: dict):
+        """Write the manifest for directory, keeping other directories' and projects' entries"""
+        data = {}
+        if manifest_path.exists():
+            try:
+                with open(manifest_path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                pass
+        data.setdefault(self.kb.project_id, {})[directory] = manifest
+        
+        tmp_file = manifest_path.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_file, manifest_path)
+    
+    def _parse_files(
+        self,
+        file_paths: list[str],
+        errors: list[str]
+    ) -> list[tuple[str, list[CodeNode] | None]]:
+        """Parse files, in a process pool unless there are only a few"""
+        if len(file_paths) < PARSE_POOL_MIN_FILES:
+            parsed = []
+            for file_path in file_paths:
+                try:
+                    parsed.append((file_path, self._parse_file(file_path)))
+                except Exception as e:
+                    errors.append(f"{file_path}: {e}")
+            return parsed
         
-        # Generate description if enabled
-        description = ""
-        if self.generate_descriptions and self.description_generator:
-            description = self.description_generator.generate(node)
-        elif node.docstring:
-            description = node.docstring
+        parse = partial(_parse_with, self.python_parser, self.ts_parser)
+        if _can_fork_safely():
+            executor = partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("fork"))
         else:
-            description = f"A {node.node_type} named {node.name}"
+            executor = ThreadPoolExecutor
+        with executor(max_workers=PARSE_WORKERS) as pool:
+            futures = [(file_path, pool.submit(parse, file_path)) for file_path in file_paths]
+            parsed = []
+            for file_path, future in futures:
+                try:
+                    parsed.append((file_path, future.result()))
+                except Exception as e:
+                    errors.append(f"{file_path}: {e}")
+            return parsed
+    
+    def _describe(self, node: CodeNode) -> str:
+        """
+        Description text for a node. Never raises - it runs in the describe
+        pool, where one failure would end the whole ordered result stream.
+        """
+        if self.generate_descriptions and self.description_generator:
+            try:
+                return self.description_generator.generate(node)
+            except Exception:
+                pass
+        if node.docstring:
+            return node.docstring
+        return f"A {node.node_type} named {node.name}"
+    
+    def _index_node(self, node: CodeNode, description: str | None = None):
+        """Buffer a single code node with description for indexing"""
+        
+        # Generate description if enabled
+        if description is None:
+            description = self._describe(node)
         
         # Build content with description + code
         content = f"""## {node.node_type.title()}: {node.name}
@@ -358,33 +870,38 @@ class EnhancedCodeIndexer:
         if node.signature:
             metadata["signature"] = node.signature
         
-        # Add to knowledge base
-        self.kb.add_document(
-            content=content,
-            doc_type="code",
-            metadata=metadata,
-            doc_id=f"{node.file_path}:{node.name}:{node.line_start}"
-        )
+        # Queue for the knowledge base
+        self._pending.append({
+            "content": content,
+            "doc_type": "code",
+            "metadata": metadata,
+            "doc_id": f"{node.file_path}:{node.name}:{node.line_start}",
+        })
     
     def _index_whole_file(self, file_path: str) -> int:
         """Index a file as a whole (for non-parseable files)"""
         path = Path(file_path)
         
         try:
+            reason = _skip_reason(file_path, path.stat().st_size)
+            if reason:
+                self.skipped.append(f"{file_path}: {reason}")
+                return 0
+            
             content = path.read_text(encoding="utf-8")
         except Exception:
             return 0
         
-        self.kb.add_document(
-            content=content,
-            doc_type="code",
-            metadata={
+        self._pending.append({
+            "content": content,
+            "doc_type": "code",
+            "metadata": {
                 "name": path.name,
                 "type": "file",
                 "file_path": str(path),
                 "extension": path.suffix
-            }
-        )
+            },
+        })
         
         return 1
 
@@ -392,14 +909,15 @@ class EnhancedCodeIndexer:
 def index_codebase(
     project_id: str,
     code_path: str,
-    generate_descriptions: bool = True
+    generate_descriptions: bool = True,
+    force: bool = False
 ) -> dict:
     """Index a codebase with enhanced semantic understanding"""
     
     kb = KnowledgeBase(project_id)
     indexer = EnhancedCodeIndexer(kb, generate_descriptions=generate_descriptions)
     
-    stats = indexer.index_directory(code_path)
+    stats = indexer.index_directory(code_path, force=force)
     
     return {
         "project_id": project_id,
@@ -409,8 +927,6 @@ def index_codebase(
 
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) < 3:
         print("Usage: python enhanced_indexing.py <project_id> <code_path>")
         sys.exit(1)
@@ -427,6 +943,9 @@ if __name__ == "__main__":
     print(f"  Files processed: {stats['files_processed']}")
     print(f"  Nodes indexed: {stats['nodes_indexed']}")
     
+    if stats["skipped"]:
+        print(f"  Skipped: {len(stats['skipped'])}")
+    
     if stats["errors"]:
         print(f"  Errors: {len(stats['errors'])}")
         for error in stats["errors"][:5]:
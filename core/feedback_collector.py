@@ -7,6 +7,7 @@ When voters reject an assessment step, this module:
 3. Checks if patterns should become deterministic rules
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
@@ -56,14 +57,23 @@ class FeedbackCollector:
     RULE_EXTRACTION_OCCURRENCES = 3
 
     # Keywords that indicate FORMAT issues (not codebase issues)
-    FORMAT_KEYWORDS = [
+    FORMAT_KEYWORDS: tuple[str, ...] = (
         "effort_hours", "effort estimate", "impact field", "empty field",
         "score lacks", "scoring", "vague", "ambiguous", "placeholder",
         "uniform", "acceptance criteria", "not defined", "unclear scale",
         "missing definition", "truncated", "estimated from", "all findings",
         "output format", "json format", "response format", "score_explanation",
         "missing field", "empty string", "no explanation"
-    ]
+    )
+
+    # Keywords that sort concerns into missing checks / incorrect findings
+    _MISSING_KWS: tuple[str, ...] = ("missing", "didn't check", "no analysis", "absent")
+    _WRONG_KWS: tuple[str, ...] = ("wrong", "incorrect", "inaccurate", "false")
+
+    # Each keyword tuple as one compiled alternation (matched on lowercased text)
+    _FORMAT_RE = re.compile("|".join(map(re.escape, FORMAT_KEYWORDS)))
+    _MISSING_RE = re.compile("|".join(map(re.escape, _MISSING_KWS)))
+    _INCORRECT_RE = re.compile("|".join(map(re.escape, _WRONG_KWS)))
 
     def __init__(self, lessons_db: Optional[LessonsDatabase] = None):
         self.lessons_db = lessons_db or LessonsDatabase()
@@ -112,9 +122,9 @@ class FeedbackCollector:
                 for concern in vote.concerns:
                     # Categorize concern
                     concern_lower = concern.lower()
-                    if any(kw in concern_lower for kw in ["missing", "didn't check", "no analysis", "absent"]):
+                    if self._MISSING_RE.search(concern_lower):
                         feedback.missing_checks.append(concern)
-                    elif any(kw in concern_lower for kw in ["wrong", "incorrect", "inaccurate", "false"]):
+                    elif self._INCORRECT_RE.search(concern_lower):
                         feedback.incorrect_findings.append(concern)
 
             # Collect suggestions
@@ -126,40 +136,66 @@ class FeedbackCollector:
         # Process concerns as potential lessons
         all_concerns = feedback.missing_checks + feedback.incorrect_findings
 
-        for concern in all_concerns:
-            self._process_concern(feedback.step_name, concern, feedback)
+        # Tokenize each suggestion once rather than once per concern
+        suggestion_tokens = [
+            (suggestion, frozenset(suggestion.lower().split()))
+            for suggestion in feedback.suggestions
+        ]
+
+        # Reasoning of the first failing voter to raise each concern
+        reason_by_concern: dict[str, str] = {}
+        for vote in feedback.votes:
+            if vote.vote == "fail":
+                for concern in vote.concerns:
+                    reason_by_concern.setdefault(concern, vote.reasoning)
+
+        # Every lesson, format rule and extracted rule for this step is
+        # written to the database file once, not once per concern
+        with self.lessons_db.deferred_save():
+            for concern in all_concerns:
+                self._process_concern(
+                    feedback.step_name, concern, feedback, suggestion_tokens, reason_by_concern
+                )
 
-        # Check if any lessons should become rules
-        self._check_rule_extraction(feedback.step_name)
+            # Check if any lessons should become rules
+            self._check_rule_extraction(feedback.step_name)
 
     def _is_format_concern(self, concern: str) -> bool:
         """Check if concern is about assessment format vs codebase content."""
-        concern_lower = concern.lower()
-        return any(kw in concern_lower for kw in self.FORMAT_KEYWORDS)
+        return bool(self._FORMAT_RE.search(concern.lower()))
 
-    def _extract_correction(self, concern: str, suggestions: list[str]) -> str:
+    def _extract_correction(
+        self,
+        concern: str,
+        concern_tokens: frozenset,
+        suggestion_tokens: list[tuple[str, frozenset]]
+    ) -> str:
         """Extract the best correction for a concern from suggestions."""
-        if not suggestions:
+        if not suggestion_tokens:
             return f"Ensure {concern.lower()}"
 
         # Try to match suggestion to concern
-        for suggestion in suggestions:
-            if self._suggestions_match_concern(concern, suggestion):
+        for suggestion, tokens in suggestion_tokens:
+            if self._suggestions_match_concern(concern_tokens, tokens):
                 return suggestion
 
-        return suggestions[0] if suggestions else f"Address: {concern}"
+        return suggestion_tokens[0][0]
 
     def _process_concern(
         self,
         step_name: str,
         concern: str,
-        feedback: StepFeedback
+        feedback: StepFeedback,
+        suggestion_tokens: list[tuple[str, frozenset]],
+        reason_by_concern: dict[str, str]
     ) -> None:
         """Process a single concern - route to format_rules or lessons."""
+        concern_tokens = frozenset(concern.lower().split())
+
         # Check if this is a format concern (about output format, not codebase)
         if self._is_format_concern(concern):
             # Format issue → store as format rule (cross-step)
-            correction = self._extract_correction(concern, feedback.suggestions)
+            correction = self._extract_correction(concern, concern_tokens, suggestion_tokens)
             self.lessons_db.add_format_rule(concern, correction, feedback.project_id)
             return
 
@@ -174,21 +210,17 @@ class FeedbackCollector:
             # Create new lesson
             # Find the best suggestion for this concern
             correction = ""
-            if feedback.suggestions:
+            if suggestion_tokens:
                 # Try to match suggestion to concern
-                for suggestion in feedback.suggestions:
-                    if self._suggestions_match_concern(concern, suggestion):
+                for suggestion, tokens in suggestion_tokens:
+                    if self._suggestions_match_concern(concern_tokens, tokens):
                         correction = suggestion
                         break
                 if not correction:
-                    correction = feedback.suggestions[0]
+                    correction = suggestion_tokens[0][0]
 
             # Get voter reasoning for context
-            voter_feedback = ""
-            for vote in feedback.votes:
-                if vote.vote == "fail" and concern in vote.concerns:
-                    voter_feedback = vote.reasoning
-                    break
+            voter_feedback = reason_by_concern.get(concern, "")
 
             self.lessons_db.create_lesson(
                 step_name=step_name,
@@ -198,13 +230,14 @@ class FeedbackCollector:
                 project_id=feedback.project_id
             )
 
-    def _suggestions_match_concern(self, concern: str, suggestion: str) -> bool:
-        """Check if a suggestion relates to a concern."""
-        concern_words = set(concern.lower().split())
-        suggestion_words = set(suggestion.lower().split())
-
+    def _suggestions_match_concern(
+        self,
+        concern_tokens: frozenset,
+        suggestion_tokens: frozenset
+    ) -> bool:
+        """Check if a suggestion relates to a concern (lowercased word sets)."""
         # Simple word overlap check
-        overlap = len(concern_words & suggestion_words)
+        overlap = len(concern_tokens & suggestion_tokens)
         return overlap >= 2
 
     def _check_rule_extraction(self, step_name: str) -> None:
@@ -12,21 +12,190 @@ Flow:
 
 import os
 import re
+import shutil
+import stat
 import subprocess
+import tempfile
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 
+try:
+    from rapidfuzz import fuzz, utils as fuzz_utils
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
 
-@dataclass
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Successful read-only gh responses are cached on disk for a short while,
+# keyed by the full argv, so repeated searches skip the CLI round-trip.
+# Responses can include private repo data, so each user gets their own
+# directory (gettempdir() is already per-user on Windows, which has no uid)
+GH_CACHE_DIR = Path(tempfile.gettempdir()) / (
+    f"ai_dev_gh_cache-{os.getuid()}" if hasattr(os, "getuid") else "ai_dev_gh_cache"
+)
+GH_CACHE_TTL = 120.0
+
+# Name normalisation patterns for variation search and similarity scoring
+_RE_SUFFIX = re.compile(r'[-_]?(app|api|web|service|backend|frontend)$')
+_RE_PREFIX = re.compile(r'^(the|my)[-_]?')
+_RE_WORDSPLIT = re.compile(r'[-_]')
+_RE_CAMEL = re.compile(r'[A-Z][a-z]+|[a-z]+')
+_RE_FULL_SPLIT = re.compile(r'[-_\s]')
+
+# Concurrent gh searches when fanning out over name variations
+GH_SEARCH_WORKERS = 8
+
+# Repository fields requested per hit in batched GraphQL searches
+_GQL_REPO_FIELDS = (
+    "name nameWithOwner url description isPrivate updatedAt "
+    "defaultBranchRef { name } primaryLanguage { name }"
+)
+
+# Options shared by every gh/git invocation
+_RUN_KW = dict(capture_output=True, text=True)
+
+
+def _run(argv: List[str], timeout: int, cwd: Optional[str] = None) -> subprocess.CompletedProcess:
+    """Run a gh/git command, capturing text output"""
+    return subprocess.run(argv, cwd=cwd, timeout=timeout, **_RUN_KW)
+
+
+async def _arun(argv: List[str], timeout: int, cwd: Optional[str] = None) -> Tuple[int, str]:
+    """Async counterpart of _run, returning (returncode, stdout)"""
+    # Imported here: asyncio costs ~50 ms at import, and the sync paths
+    # (gh probes, local git commands) never need it
+    import asyncio
+    proc = await asyncio.create_subprocess_exec(
+        *argv, cwd=cwd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout.decode("utf-8", errors="replace")
+
+
+def _json_loads(data: str):
+    """Decode gh --json output with orjson when available, else the stdlib"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1)
+def _run_gh_version() -> Tuple[int, str]:
+    """`gh --version`, run at most once per process"""
+    try:
+        result = _run(["gh", "--version"], timeout=5)
+        return result.returncode, result.stdout
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return -1, ""
+
+
+@lru_cache(maxsize=1)
+def _run_gh_auth_status() -> Tuple[int, str]:
+    """`gh auth status`, run at most once per process"""
+    try:
+        result = _run(["gh", "auth", "status"], timeout=10)
+        return result.returncode, result.stdout
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return -1, ""
+
+
+@lru_cache(maxsize=1)
+def _gh_user_login() -> str:
+    """
+    `gh api user --jq .login` output, memoised once it succeeds. Failures
+    raise, and lru_cache does not memoise exceptions, so a transient
+    network error is retried on the next call.
+    """
+    result = _run(["gh", "api", "user", "--jq", ".login"], timeout=10)
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(result.returncode, result.args)
+    return result.stdout
+
+
+def _run_gh_user() -> Tuple[int, str]:
+    """`gh api user --jq .login`, run at most once per process once it succeeds"""
+    try:
+        return 0, _gh_user_login()
+    except subprocess.CalledProcessError as e:
+        return e.returncode, ""
+    except Exception:
+        return -1, ""
+
+
+def _git_stamp(directory: str, name: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, inode) of .git/<name>, or None if there is no such file"""
+    try:
+        st = os.stat(os.path.join(directory, ".git", name))
+        return st.st_mtime_ns, st.st_ino
+    except OSError:
+        return None
+
+
+def _git_output(directory: str, argv: Tuple[str, ...]) -> Optional[str]:
+    """Stripped stdout of a git command, or None if it failed"""
+    result = _run(list(argv), cwd=directory, timeout=10)
+    if result.returncode == 0:
+        return result.stdout.strip()
+    return None
+
+
+@lru_cache(maxsize=256)
+def _git_output_cached(directory: str, argv: Tuple[str, ...], stamp: Tuple[int, int]) -> Optional[str]:
+    return _git_output(directory, argv)
+
+
+def _git_query(directory: str, argv: Tuple[str, ...], stamp_file: str) -> Optional[str]:
+    """
+    Run a read-only git query, memoised until .git/<stamp_file> changes.
+    Falls back to running it every time when there is no .git directory
+    (subdirectories, worktrees).
+    """
+    stamp = _git_stamp(directory, stamp_file)
+    if stamp is None:
+        return _git_output(directory, argv)
+    return _git_output_cached(os.path.abspath(directory), argv, stamp)
+
+
+@dataclass(frozen=True, slots=True)
+class _SimKey:
+    """A name normalised once for repeated similarity scoring"""
+    raw: str
+    normalized: str
+    words: frozenset
+
+
+def _make_simkey(name: str) -> _SimKey:
+    """Lowercase and strip a name into its comparison forms"""
+    lowered = name.lower()
+    return _SimKey(
+        raw=name,
+        normalized=lowered.replace("-", "").replace("_", ""),
+        words=frozenset(_RE_FULL_SPLIT.split(lowered)),
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class GitHubRepo:
     """Represents a GitHub repository"""
     name: str
     full_name: str  # owner/repo
     url: str
-    clone_url: str
-    ssh_url: str
     description: Optional[str]
     private: bool
     default_branch: str
@@ -36,6 +205,14 @@ class GitHubRepo:
     @property
     def owner(self) -> str:
         return self.full_name.split("/")[0]
+    
+    @property
+    def clone_url(self) -> str:
+        return f"https://github.com/{self.full_name}.git"
+    
+    @property
+    def ssh_url(self) -> str:
+        return f"git@github.com:{self.full_name}.git"
 
 
 class GitHubIntegration:
@@ -49,8 +226,89 @@ class GitHubIntegration:
     def __init__(self, default_org: Optional[str] = None):
         self.default_org = default_org or os.environ.get("GITHUB_ORG")
         self.default_visibility = os.environ.get("GITHUB_DEFAULT_VISIBILITY", "private")
-        self._gh_available = None
-        self._authenticated = None
+    
+    def _cached_gh(self, argv: List[str], timeout: int, ttl: float = GH_CACHE_TTL) -> Tuple[int, str]:
+        """
+        Run a read-only gh command, returning (returncode, stdout).
+        Only successful output is cached, so a miss is always rechecked.
+        """
+        cache_file = self._cache_file(argv)
+        cached = self._read_cache(cache_file, ttl)
+        if cached is not None:
+            return 0, cached
+        
+        result = _run(argv, timeout=timeout)
+        
+        if result.returncode == 0:
+            self._write_cache(cache_file, result.stdout)
+        
+        return result.returncode, result.stdout
+    
+    async def _acached_gh(self, argv: List[str], timeout: int, ttl: float = GH_CACHE_TTL) -> Tuple[int, str]:
+        """Async counterpart of _cached_gh, sharing the same on-disk cache"""
+        cache_file = self._cache_file(argv)
+        cached = self._read_cache(cache_file, ttl)
+        if cached is not None:
+            return 0, cached
+        
+        returncode, stdout = await _arun(argv, timeout=timeout)
+        
+        if returncode == 0:
+            self._write_cache(cache_file, stdout)
+        
+        return returncode, stdout
+    
+    def _cache_file(self, argv: List[str]) -> Path:
+        """Cache entry for a gh command line"""
+        import hashlib
+        key = hashlib.blake2b("\0".join(argv).encode("utf-8"), digest_size=16).hexdigest()
+        return GH_CACHE_DIR / key
+    
+    def _cache_dir_ok(self, create: bool = False) -> bool:
+        """
+        True if GH_CACHE_DIR is a real directory only we can use.
+        Anything else (a symlink, another user's directory, loose
+        permissions) may have been planted, so the cache is skipped.
+        """
+        try:
+            if create:
+                GH_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            st = GH_CACHE_DIR.lstat()
+        except OSError:
+            return False
+        if not stat.S_ISDIR(st.st_mode):
+            return False
+        if hasattr(os, "getuid"):
+            return st.st_uid == os.getuid() and not st.st_mode & 0o077
+        return True
+    
+    def _read_cache(self, cache_file: Path, ttl: float) -> Optional[str]:
+        """Cached stdout if younger than ttl, else None"""
+        if not self._cache_dir_ok():
+            return None
+        try:
+            if time.time() - cache_file.stat().st_mtime < ttl:
+                return cache_file.read_text(encoding="utf-8")
+        except OSError:
+            pass
+        return None
+    
+    def _write_cache(self, cache_file: Path, stdout: str):
+        """Atomically store stdout, ignoring filesystem errors"""
+        if not self._cache_dir_ok(create=True):
+            return
+        try:
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(stdout)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+    
+    def clear_cache(self):
+        """Drop cached gh responses (e.g. after creating a repo)"""
+        shutil.rmtree(GH_CACHE_DIR, ignore_errors=True)
     
     # ════════════════════════════════════════════════════════════
     # AVAILABILITY CHECKS
@@ -58,49 +316,27 @@ class GitHubIntegration:
     
     def is_gh_available(self) -> bool:
         """Check if GitHub CLI is installed"""
-        if self._gh_available is None:
-            try:
-                result = subprocess.run(
-                    ["gh", "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                self._gh_available = result.returncode == 0
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                self._gh_available = False
-        return self._gh_available
+        return _run_gh_version()[0] == 0
     
     def is_authenticated(self) -> bool:
         """Check if user is authenticated with GitHub"""
-        if self._authenticated is None:
-            try:
-                result = subprocess.run(
-                    ["gh", "auth", "status"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                self._authenticated = result.returncode == 0
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                self._authenticated = False
-        return self._authenticated
+        return _run_gh_auth_status()[0] == 0
     
     def get_authenticated_user(self) -> Optional[str]:
         """Get the authenticated GitHub username"""
-        try:
-            result = subprocess.run(
-                ["gh", "api", "user", "--jq", ".login"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except:
-            pass
+        returncode, stdout = _run_gh_user()
+        if returncode == 0:
+            return stdout.strip()
         return None
     
+    @classmethod
+    def invalidate(cls):
+        """Forget the CLI, auth and user probes (e.g. after `gh auth login`) and memoised git queries"""
+        _run_gh_version.cache_clear()
+        _run_gh_auth_status.cache_clear()
+        _gh_user_login.cache_clear()
+        _git_output_cached.cache_clear()
+    
     # ════════════════════════════════════════════════════════════
     # REPOSITORY SEARCH
     # ════════════════════════════════════════════════════════════
@@ -125,51 +361,54 @@ class GitHubIntegration:
         if not self.is_gh_available() or not self.is_authenticated():
             return []
         
-        # Build search query
-        search_query = query
-        if owner:
-            search_query = f"{query} user:{owner}"
-        
         try:
             # Search using gh cli
-            result = subprocess.run(
-                [
-                    "gh", "search", "repos", search_query,
-                    "--limit", str(limit),
-                    "--json", "name,fullName,url,description,isPrivate,defaultBranch,updatedAt,primaryLanguage"
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            returncode, stdout = self._cached_gh(self._search_argv(query, owner, limit), timeout=30)
             
-            if result.returncode != 0:
+            if returncode != 0:
                 return []
             
-            import json
-            repos_data = json.loads(result.stdout)
+            return [self._repo_from_json(r) for r in _json_loads(stdout)]
             
-            repos = []
-            for r in repos_data:
-                repos.append(GitHubRepo(
-                    name=r.get("name", ""),
-                    full_name=r.get("fullName", ""),
-                    url=r.get("url", ""),
-                    clone_url=f"https://github.com/{r.get('fullName', '')}.git",
-                    ssh_url=f"git@github.com:{r.get('fullName', '')}.git",
-                    description=r.get("description"),
-                    private=r.get("isPrivate", False),
-                    default_branch=r.get("defaultBranch", "main"),
-                    updated_at=r.get("updatedAt", ""),
-                    language=r.get("primaryLanguage", {}).get("name") if r.get("primaryLanguage") else None,
-                ))
+        except Exception as e:
+            print(f"Search failed: {e}")
+            return []
+    
+    async def asearch_repos(
+        self,
+        query: str,
+        owner: Optional[str] = None,
+        limit: int = 10
+    ) -> List[GitHubRepo]:
+        """Async version of search_repos, for fanning out on an event loop"""
+        if not self.is_gh_available() or not self.is_authenticated():
+            return []
+        
+        try:
+            returncode, stdout = await self._acached_gh(self._search_argv(query, owner, limit), timeout=30)
+            
+            if returncode != 0:
+                return []
             
-            return repos
+            return [self._repo_from_json(r) for r in _json_loads(stdout)]
             
         except Exception as e:
             print(f"Search failed: {e}")
             return []
     
+    def _search_argv(self, query: str, owner: Optional[str], limit: int) -> List[str]:
+        """gh command line for a single repo search"""
+        # Build search query
+        search_query = query
+        if owner:
+            search_query = f"{query} user:{owner}"
+        
+        return [
+            "gh", "search", "repos", search_query,
+            "--limit", str(limit),
+            "--json", "name,fullName,url,description,isPrivate,defaultBranch,updatedAt,primaryLanguage"
+        ]
+    
     def search_user_repos(
         self,
         query: str,
@@ -203,23 +442,76 @@ class GitHubIntegration:
         
         Returns list of (repo, similarity_score) tuples.
         """
-        # Search with the name and variations
-        variations = self._generate_name_variations(name)
+        queries = self._similar_queries(name)
+        results = self._search_repos_batch(queries, limit=5) if queries else []
+        
+        if results is None:
+            # GraphQL unavailable - fall back to one REST search per query
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=GH_SEARCH_WORKERS) as pool:
+                results = list(pool.map(
+                    lambda query: self.search_repos(query[0], owner=query[1], limit=5),
+                    queries
+                ))
+        
+        return self._rank_similar(name, results, limit)
+    
+    async def afind_similar_repos(
+        self,
+        name: str,
+        limit: int = 10
+    ) -> List[Tuple[GitHubRepo, float]]:
+        """Async version of find_similar_repos"""
+        queries = self._similar_queries(name)
+        results = await self._asearch_repos_batch(queries, limit=5) if queries else []
+        
+        if results is None:
+            import asyncio
+            results = await asyncio.gather(*(
+                self.asearch_repos(query, owner=owner, limit=5)
+                for query, owner in queries
+            ))
         
+        return self._rank_similar(name, results, limit)
+    
+    def _similar_queries(self, name: str) -> List[Tuple[str, str]]:
+        """(variation, owner) searches to run for find_similar_repos"""
+        # Search with the name and variations. GitHub search splits on
+        # case, hyphens and underscores, so variations that only differ
+        # there ("my-app" / "my app") return the same hits - query once
+        variations = []
+        seen_queries = set()
+        for variation in self._generate_name_variations(name):
+            key = " ".join(_RE_FULL_SPLIT.sub(" ", variation.lower()).split())
+            if key and key not in seen_queries:
+                seen_queries.add(key)
+                variations.append(variation)
+        
+        # Search the user's repos, and the org's if configured, for every variation
+        owners = [self.get_authenticated_user(), self.default_org]
+        return [
+            (variation, owner)
+            for variation in variations
+            for owner in owners
+            if owner
+        ]
+    
+    def _rank_similar(
+        self,
+        name: str,
+        results: List[List[GitHubRepo]],
+        limit: int
+    ) -> List[Tuple[GitHubRepo, float]]:
+        """Merge per-query results, dedupe by full name and rank by similarity"""
         all_repos = []
         seen = set()
+        name_key = _make_simkey(name)
         
-        for variation in variations:
-            repos = self.search_user_repos(variation, limit=5)
-            
-            # Also search org if configured
-            if self.default_org:
-                repos.extend(self.search_org_repos(variation, limit=5))
-            
+        for repos in results:
             for repo in repos:
                 if repo.full_name not in seen:
                     seen.add(repo.full_name)
-                    similarity = self._calculate_similarity(name, repo.name)
+                    similarity = self._similarity_from_key(name_key, repo.name)
                     all_repos.append((repo, similarity))
         
         # Sort by similarity
@@ -227,34 +519,114 @@ class GitHubIntegration:
         
         return all_repos[:limit]
     
+    def _search_repos_batch(
+        self,
+        queries: List[Tuple[str, Optional[str]]],
+        limit: int = 5
+    ) -> Optional[List[List[GitHubRepo]]]:
+        """
+        Run several (query, owner) searches in a single `gh api graphql` call,
+        one aliased search per query.
+        
+        Returns one result list per query, or None if the call failed.
+        """
+        if not self.is_gh_available() or not self.is_authenticated():
+            return [[] for _ in queries]
+        
+        try:
+            returncode, stdout = self._cached_gh(self._batch_search_argv(queries, limit), timeout=30)
+            if returncode != 0:
+                return None
+            return self._parse_batch_search(stdout, len(queries))
+            
+        except Exception as e:
+            print(f"Batched search failed: {e}")
+            return None
+    
+    async def _asearch_repos_batch(
+        self,
+        queries: List[Tuple[str, Optional[str]]],
+        limit: int = 5
+    ) -> Optional[List[List[GitHubRepo]]]:
+        """Async version of _search_repos_batch"""
+        if not self.is_gh_available() or not self.is_authenticated():
+            return [[] for _ in queries]
+        
+        try:
+            returncode, stdout = await self._acached_gh(self._batch_search_argv(queries, limit), timeout=30)
+            if returncode != 0:
+                return None
+            return self._parse_batch_search(stdout, len(queries))
+            
+        except Exception as e:
+            print(f"Batched search failed: {e}")
+            return None
+    
+    def _batch_search_argv(self, queries: List[Tuple[str, Optional[str]]], limit: int) -> List[str]:
+        """gh api graphql command line with one aliased search per query"""
+        # Search strings go in as variables, so no GraphQL escaping is needed
+        params = ", ".join(f"$q{i}: String!" for i in range(len(queries)))
+        searches = " ".join(
+            f"v{i}: search(query: $q{i}, type: REPOSITORY, first: {limit}) "
+            f"{{ nodes {{ ... on Repository {{ {_GQL_REPO_FIELDS} }} }} }}"
+            for i in range(len(queries))
+        )
+        argv = ["gh", "api", "graphql", "-f", f"query=query({params}) {{ {searches} }}"]
+        for i, (query, owner) in enumerate(queries):
+            argv.extend(["-f", f"q{i}={query} user:{owner}" if owner else f"q{i}={query}"])
+        return argv
+    
+    def _parse_batch_search(self, stdout: str, count: int) -> List[List[GitHubRepo]]:
+        """Split a batched GraphQL search response back into per-query results"""
+        data = _json_loads(stdout)["data"]
+        return [
+            [
+                self._repo_from_json({
+                    **node,
+                    "fullName": node["nameWithOwner"],
+                    "defaultBranch": (node.get("defaultBranchRef") or {}).get("name", "main"),
+                })
+                for node in (data.get(f"v{i}") or {}).get("nodes", [])
+                if node and node.get("nameWithOwner")
+            ]
+            for i in range(count)
+        ]
+    
     def _generate_name_variations(self, name: str) -> List[str]:
         """Generate search variations for a name"""
         variations = [name]
         
         # Remove common suffixes/prefixes
         clean = name.lower()
-        clean = re.sub(r'[-_]?(app|api|web|service|backend|frontend)$', '', clean)
-        clean = re.sub(r'^(the|my)[-_]?', '', clean)
+        clean = _RE_SUFFIX.sub('', clean)
+        clean = _RE_PREFIX.sub('', clean)
         
         if clean != name.lower():
             variations.append(clean)
         
         # kebab-case to words
-        words = re.split(r'[-_]', name.lower())
+        words = _RE_WORDSPLIT.split(name.lower())
         if len(words) > 1:
             variations.append(" ".join(words))
         
         # CamelCase to words
-        camel_words = re.findall(r'[A-Z][a-z]+|[a-z]+', name)
+        camel_words = _RE_CAMEL.findall(name)
         if len(camel_words) > 1:
             variations.append(" ".join(w.lower() for w in camel_words))
         
-        return list(set(variations))
+        # Dedupe keeping priority order: the name itself, then the cleaned
+        # form, then word splits
+        return list(dict.fromkeys(variations))
     
     def _calculate_similarity(self, name1: str, name2: str) -> float:
         """Calculate name similarity (0-1)"""
-        n1 = name1.lower().replace("-", "").replace("_", "")
-        n2 = name2.lower().replace("-", "").replace("_", "")
+        return self._similarity_from_key(_make_simkey(name1), name2)
+    
+    def _similarity_from_key(self, key1: _SimKey, name2: str) -> float:
+        """Similarity against a pre-normalised name, for scoring many candidates"""
+        key2 = _make_simkey(name2)
+        n1 = key1.normalized
+        n2 = key2.normalized
         
         # Exact match
         if n1 == n2:
@@ -264,9 +636,14 @@ class GitHubIntegration:
         if n1 in n2 or n2 in n1:
             return 0.8
         
+        # Fuzzy token match when rapidfuzz is installed - it also catches
+        # near-misses like "my-project" vs "myproject-api"
+        if HAS_RAPIDFUZZ:
+            return fuzz.token_set_ratio(key1.raw, name2, processor=fuzz_utils.default_process) / 100 * 0.7
+        
         # Word overlap
-        words1 = set(re.split(r'[-_\s]', name1.lower()))
-        words2 = set(re.split(r'[-_\s]', name2.lower()))
+        words1 = key1.words
+        words2 = key2.words
         
         if words1 and words2:
             overlap = len(words1 & words2)
@@ -282,13 +659,11 @@ class GitHubIntegration:
     def repo_exists(self, full_name: str) -> bool:
         """Check if a specific repo exists"""
         try:
-            result = subprocess.run(
+            returncode, _ = self._cached_gh(
                 ["gh", "repo", "view", full_name, "--json", "name"],
-                capture_output=True,
-                text=True,
                 timeout=10
             )
-            return result.returncode == 0
+            return returncode == 0
         except:
             return False
     
@@ -335,17 +710,32 @@ class GitHubIntegration:
         cmd.append("--confirm")
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            result = _run(cmd, timeout=30)
             
             if result.returncode == 0:
-                # Get the created repo info
-                repo_name = f"{org or self.default_org or self.get_authenticated_user()}/{name}"
-                return self.get_repo(repo_name)
+                # Searches and lookups cached before the repo existed are stale
+                self.clear_cache()
+                self.invalidate()
+                
+                # gh prints the new repo's URL; everything else is already
+                # known, so build the info locally instead of a `gh repo view`
+                url = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+                if url.startswith("https://github.com/"):
+                    repo_name = url[len("https://github.com/"):].rstrip("/")
+                else:
+                    repo_name = f"{org or self.default_org or self.get_authenticated_user()}/{name}"
+                    url = f"https://github.com/{repo_name}"
+                
+                return GitHubRepo(
+                    name=name,
+                    full_name=repo_name,
+                    url=url,
+                    description=description,
+                    private=private,
+                    default_branch="main",
+                    updated_at=datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    language=None,
+                )
             else:
                 print(f"Failed to create repo: {result.stderr}")
                 return None
@@ -357,39 +747,37 @@ class GitHubIntegration:
     def get_repo(self, full_name: str) -> Optional[GitHubRepo]:
         """Get repository details"""
         try:
-            result = subprocess.run(
+            returncode, stdout = self._cached_gh(
                 [
                     "gh", "repo", "view", full_name,
                     "--json", "name,url,description,isPrivate,defaultBranch,updatedAt,primaryLanguage"
                 ],
-                capture_output=True,
-                text=True,
                 timeout=15
             )
             
-            if result.returncode != 0:
+            if returncode != 0:
                 return None
             
-            import json
-            r = json.loads(result.stdout)
-            
-            return GitHubRepo(
-                name=r.get("name", ""),
-                full_name=full_name,
-                url=r.get("url", ""),
-                clone_url=f"https://github.com/{full_name}.git",
-                ssh_url=f"git@github.com:{full_name}.git",
-                description=r.get("description"),
-                private=r.get("isPrivate", False),
-                default_branch=r.get("defaultBranch", "main"),
-                updated_at=r.get("updatedAt", ""),
-                language=r.get("primaryLanguage", {}).get("name") if r.get("primaryLanguage") else None,
-            )
+            return self._repo_from_json(_json_loads(stdout), full_name)
             
         except Exception as e:
             print(f"Error getting repo: {e}")
             return None
     
+    def _repo_from_json(self, r: dict, full_name: Optional[str] = None) -> GitHubRepo:
+        """Build a GitHubRepo from one object of gh --json output"""
+        full_name = full_name or r.get("fullName", "")
+        return GitHubRepo(
+            name=r.get("name", ""),
+            full_name=full_name,
+            url=r.get("url", ""),
+            description=r.get("description"),
+            private=r.get("isPrivate", False),
+            default_branch=r.get("defaultBranch", "main"),
+            updated_at=r.get("updatedAt", ""),
+            language=r.get("primaryLanguage", {}).get("name") if r.get("primaryLanguage") else None,
+        )
+    
     def clone_repo(
         self,
         full_name: str,
@@ -413,12 +801,7 @@ class GitHubIntegration:
             cmd.extend(["--", "-b", branch])
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            result = _run(cmd, timeout=120)
             return result.returncode == 0
         except Exception as e:
             print(f"Clone failed: {e}")
@@ -431,13 +814,7 @@ class GitHubIntegration:
     def init_local_repo(self, directory: str) -> bool:
         """Initialize a git repo in directory"""
         try:
-            result = subprocess.run(
-                ["git", "init"],
-                cwd=directory,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = _run(["git", "init"], cwd=directory, timeout=10)
             return result.returncode == 0
         except:
             return False
@@ -450,11 +827,9 @@ class GitHubIntegration:
     ) -> bool:
         """Add GitHub remote to local repo"""
         try:
-            result = subprocess.run(
+            result = _run(
                 ["git", "remote", "add", remote_name, repo.clone_url],
                 cwd=directory,
-                capture_output=True,
-                text=True,
                 timeout=10
             )
             return result.returncode == 0
@@ -469,26 +844,25 @@ class GitHubIntegration:
     ) -> bool:
         """Stage all changes and commit"""
         try:
-            # Add all
-            subprocess.run(
-                ["git", "add", "-A"],
+            # `commit -a` stages modified and deleted tracked files itself;
+            # only new untracked files still need a separate `add -A`
+            untracked = _run(
+                ["git", "ls-files", "--others", "--exclude-standard",
+                 "--directory", "--no-empty-directory", "-z"],
                 cwd=directory,
-                capture_output=True,
                 timeout=30
             )
             
-            # Commit
-            cmd = ["git", "commit", "-m", message]
+            if untracked.returncode == 0 and not untracked.stdout:
+                cmd = ["git", "commit", "-a", "-m", message]
+            else:
+                _run(["git", "add", "-A"], cwd=directory, timeout=30)
+                cmd = ["git", "commit", "-m", message]
+            
             if author:
                 cmd.extend(["--author", author])
             
-            result = subprocess.run(
-                cmd,
-                cwd=directory,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            result = _run(cmd, cwd=directory, timeout=30)
             return result.returncode == 0
         except:
             return False
@@ -509,13 +883,7 @@ class GitHubIntegration:
             if branch:
                 cmd.append(branch)
             
-            result = subprocess.run(
-                cmd,
-                cwd=directory,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            result = _run(cmd, cwd=directory, timeout=60)
             return result.returncode == 0
         except:
             return False
@@ -533,53 +901,32 @@ class GitHubIntegration:
             else:
                 cmd = ["git", "branch", branch_name]
             
-            result = subprocess.run(
-                cmd,
-                cwd=directory,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = _run(cmd, cwd=directory, timeout=10)
             return result.returncode == 0
         except:
             return False
     
     def get_current_branch(self, directory: str) -> Optional[str]:
-        """Get current branch name"""
+        """Get current branch name (cached until .git/HEAD changes)"""
         try:
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                cwd=directory,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
+            return _git_query(directory, ("git", "branch", "--show-current"), "HEAD")
         except:
-            pass
-        return None
+            return None
     
     def is_git_repo(self, directory: str) -> bool:
-        """Check if directory is a git repository"""
-        git_dir = Path(directory) / ".git"
-        return git_dir.exists()
+        """Check if directory is a git repository (.git may be a worktree/submodule file)"""
+        try:
+            os.stat(os.path.join(directory, ".git"))
+            return True
+        except OSError:
+            return False
     
     def get_remote_url(self, directory: str, remote: str = "origin") -> Optional[str]:
-        """Get remote URL for a local repo"""
+        """Get remote URL for a local repo (cached until .git/config changes)"""
         try:
-            result = subprocess.run(
-                ["git", "remote", "get-url", remote],
-                cwd=directory,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
+            return _git_query(directory, ("git", "remote", "get-url", remote), "config")
         except:
-            pass
-        return None
+            return None
 
 
 # ════════════════════════════════════════════════════════════
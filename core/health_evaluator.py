@@ -4,14 +4,148 @@ Health Evaluator Module
 Evaluates the health of a codebase across multiple dimensions.
 """
 
+import copy
 import os
+import re
 import json
+import mmap
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Parsed file contents keyed by path and stamped with (mtime_ns, size), so
+# repeat evaluations of an unchanged project skip re-reading and re-parsing.
+# An edit replaces the file's entry rather than adding one.
+_PARSE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_MISS = object()
+
+
+def _cache_get(path: Path, stamp: Tuple[int, int]) -> Any:
+    """A copy of path's cached parse if its stamp still matches, else _MISS"""
+    cached = _PARSE_CACHE.get(str(path))
+    if cached is not None and cached[0] == stamp:
+        # Copied so callers can't mutate what later evaluations see
+        return copy.deepcopy(cached[1])
+    return _MISS
+
+
+def _cache_put(path: Path, stamp: Tuple[int, int], value: Any):
+    """Cache a private copy of path's parse under its current stamp"""
+    _PARSE_CACHE[str(path)] = (stamp, copy.deepcopy(value))
+
+# JSON copy of a parsed project.yaml, kept next to it for later processes
+PROJECT_YAML_SIDECAR = ".project.yaml.cache.json"
+
+# Windows and (by default) macOS filesystems ignore case, so there
+# "Readme.md" satisfies a README.md probe just as Path.exists() did
+_CASE_INSENSITIVE_FS = os.path.normcase("A") == "a" or sys.platform == "darwin"
+
+
+class _DirEntries(dict):
+    """
+    Entry name -> os.DirEntry for one directory. On case-insensitive
+    platforms names are matched ignoring case, like the filesystem does.
+    """
+    
+    def __init__(self, entries=()):
+        super().__init__((self._fold(entry.name), entry) for entry in entries)
+    
+    @staticmethod
+    def _fold(name: str) -> str:
+        return name.lower() if _CASE_INSENSITIVE_FS else name
+    
+    def __contains__(self, name) -> bool:
+        return super().__contains__(self._fold(name))
+    
+    def __getitem__(self, name):
+        return super().__getitem__(self._fold(name))
+
+
+# The category evaluators are independent and mostly wait on file reads
+EVALUATOR_WORKERS = 6
+SECRET_SCAN_WORKERS = 8
+
+
+def _json_loads(data):
+    """Decode JSON with orjson when available, else the stdlib"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_cached(path: Path, parse: Callable[[str], Any]) -> Any:
+    """Read and parse a text file, memoised until it changes on disk"""
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    value = _cache_get(path, stamp)
+    if value is not _MISS:
+        return value
+    
+    value = parse(path.read_text(encoding="utf-8"))
+    _cache_put(path, stamp, value)
+    return value
+
+
+def _load_project_yaml(path: Path) -> dict:
+    """
+    Load project.yaml, memoised in-process and via a JSON sidecar that
+    stays valid while the YAML file's mtime and size are unchanged.
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    config = _cache_get(path, stamp)
+    if config is not _MISS:
+        return config
+    
+    sidecar = path.with_name(PROJECT_YAML_SIDECAR)
+    config = None
+    try:
+        with open(sidecar, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+            config = cached["config"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    
+    if config is None:
+        with open(path, encoding="utf-8") as f:
+            config = yaml.load(f, Loader=_YamlLoader)
+        
+        # YAML values JSON can't represent (dates, sets) or would change
+        # (non-string keys, tuples) just skip the sidecar
+        try:
+            payload = json.dumps(
+                {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "config": config},
+                separators=(",", ":"),
+            )
+            if json.loads(payload)["config"] != config:
+                raise ValueError("config does not round-trip through JSON")
+            tmp = sidecar.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, sidecar)
+        except (TypeError, ValueError, OSError):
+            pass
+    
+    _cache_put(path, stamp, config)
+    return config
+
 
 @dataclass
 class CategoryScore:
@@ -21,6 +155,30 @@ class CategoryScore:
     status: str  # critical, warning, good, excellent
     issues: list = field(default_factory=list)
     recommendations: list = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        """Plain dict for the report - shallow list copies, unlike asdict's deep copy"""
+        return {
+            "name": self.name,
+            "score": self.score,
+            "status": self.status,
+            "issues": list(self.issues),
+            "recommendations": list(self.recommendations),
+        }
+
+
+@dataclass
+class FileBuckets:
+    """file_index entries grouped the way the evaluators consume them"""
+    large: list = field(default_factory=list)  # > 500 lines
+    god: list = field(default_factory=list)  # > 1000 lines
+    ts: list = field(default_factory=list)
+    js: list = field(default_factory=list)
+    test: list = field(default_factory=list)
+    source: list = field(default_factory=list)  # known language
+    secret_candidates: list = field(default_factory=list)  # scannable, within the first 100
+    has_auth: bool = False
+    has_api_docs: bool = False
 
 
 @dataclass 
@@ -50,21 +208,51 @@ class HealthReport:
     improvement_summary: dict
 
 
-# Score thresholds
+# Path classification flags for file_index entries
+_PATH_TEST = 1
+_PATH_AUTH = 2
+_PATH_API_DOC = 4
+
+_TEST_PATH_RE = re.compile(r'\.(?:test|spec)\.|_test\.|/tests?/')
+
+# "2-4 hours" / "1 hour" style effort estimates
+_EFFORT_HOURS_RE = re.compile(r'\s*(\d+)\s*(?:-\s*(\d+)\s*)?hours?\s*')
+
+# Major version of a "^17.0.2" / "~18" style npm range
+_VER_MAJOR = re.compile(r'[\^~\s]*(\d+)\s*(?:\.|$)')
+
+
+@lru_cache(maxsize=65536)
+def _classify_path(path: str) -> int:
+    """_PATH_* flags for a relative path (memoised across evaluations)"""
+    flags = _PATH_TEST if _TEST_PATH_RE.search(path) else 0
+    lower = path.lower()
+    if "auth" in lower:
+        flags |= _PATH_AUTH
+    if "api" in lower and ("doc" in lower or "swagger" in lower or "openapi" in lower):
+        flags |= _PATH_API_DOC
+    return flags
+
+
+# Score thresholds, as a table indexed by the clamped 0-100 score:
+# <40 critical, 40-59 warning, 60-79 good, 80+ excellent
+_STATUSES = ("critical", "warning", "good", "excellent")
+_STATUS_IDX = bytes([0] * 40 + [1] * 20 + [2] * 20 + [3] * 21)
+
+
 def get_status(score: int) -> str:
-    if score >= 80:
-        return "excellent"
-    elif score >= 60:
-        return "good"
-    elif score >= 40:
-        return "warning"
-    else:
-        return "critical"
+    return _STATUSES[_STATUS_IDX[max(0, min(100, int(score)))]]
 
 
 class HealthEvaluator:
     """Evaluates codebase health"""
     
+    # A secret-like key in matching quotes, e.g. "api_key" or 'Token'
+    _SECRET_RE = re.compile(
+        rb'(["\'])(?:api_key|apikey|secret|password|token|credential)\1',
+        re.IGNORECASE
+    )
+    
     def __init__(self, projects_dir: str = "projects"):
         self.projects_dir = Path(projects_dir)
     
@@ -83,8 +271,7 @@ class HealthEvaluator:
             raise ValueError(f"Project not found: {project_name}")
         
         # Load project config
-        with open(project_dir / "project.yaml", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = _load_project_yaml(project_dir / "project.yaml")
         
         source_path = Path(config["project"].get("source_path", ""))
         if not source_path.exists():
@@ -93,37 +280,39 @@ class HealthEvaluator:
         # Load file index
         file_index = []
         file_index_path = project_dir / "file_index.json"
-        if file_index_path.exists():
-            with open(file_index_path, encoding="utf-8") as f:
-                file_index = json.load(f)
-        
-        # Run evaluations
-        categories = []
-        all_issues = []
-        
-        # Code Quality
-        code_quality = self._evaluate_code_quality(source_path, file_index, config)
-        categories.append(code_quality)
+        try:
+            # Raw bytes straight to the parser - orjson skips the decode step
+            file_index = _json_loads(file_index_path.read_bytes())
+        except FileNotFoundError:
+            pass
         
-        # Test Coverage
-        test_coverage = self._evaluate_test_coverage(source_path, file_index, config)
-        categories.append(test_coverage)
+        # List the source root once - the evaluators only probe top-level
+        # names, so membership tests replace a stat() per probe
+        entries = self._scan_dir(source_path)
         
-        # Security
-        security = self._evaluate_security(source_path, file_index, config)
-        categories.append(security)
+        # Group the index in one pass rather than one filter per check
+        buckets = self._bucket_files(file_index)
         
-        # Dependencies
-        dependencies = self._evaluate_dependencies(source_path, config)
-        categories.append(dependencies)
-        
-        # Documentation
-        documentation = self._evaluate_documentation(source_path, file_index, config)
-        categories.append(documentation)
+        # Run evaluations - each only reads the shared inputs, so they run
+        # side by side; results are collected in category order
+        all_issues = []
         
-        # Architecture
-        architecture = self._evaluate_architecture(source_path, file_index, config)
-        categories.append(architecture)
+        with ThreadPoolExecutor(max_workers=EVALUATOR_WORKERS) as pool:
+            futures = [
+                # Code Quality
+                pool.submit(self._evaluate_code_quality, source_path, entries, buckets, config),
+                # Test Coverage
+                pool.submit(self._evaluate_test_coverage, source_path, buckets, config),
+                # Security
+                pool.submit(self._evaluate_security, source_path, entries, buckets, config),
+                # Dependencies
+                pool.submit(self._evaluate_dependencies, source_path, entries, config),
+                # Documentation
+                pool.submit(self._evaluate_documentation, source_path, entries, buckets, config),
+                # Architecture
+                pool.submit(self._evaluate_architecture, source_path, entries, buckets, config),
+            ]
+            categories = [future.result() for future in futures]
         
         # Collect all issues
         for cat in categories:
@@ -157,21 +346,68 @@ class HealthEvaluator:
             evaluated_at=datetime.now().isoformat(),
             overall_score=overall_score,
             overall_status=overall_status,
-            categories=[asdict(c) for c in categories],
+            categories=[c.to_dict() for c in categories],
             critical_issues=critical_issues,
             high_issues=high_issues,
             quick_wins=quick_wins,
             improvement_summary=improvement_summary,
         )
     
-    def _evaluate_code_quality(self, source: Path, files: list, config: dict) -> CategoryScore:
+    def _scan_dir(self, directory: Path) -> _DirEntries:
+        """Map entry names to os.DirEntry for one directory (empty if unreadable)"""
+        try:
+            with os.scandir(directory) as it:
+                return _DirEntries(it)
+        except OSError:
+            return _DirEntries()
+    
+    def _bucket_files(self, files: list) -> FileBuckets:
+        """Sort file_index entries into FileBuckets in a single pass"""
+        buckets = FileBuckets()
+        large, god = buckets.large, buckets.god
+        ts, js = buckets.ts, buckets.js
+        test, source = buckets.test, buckets.source
+        secret_candidates = buckets.secret_candidates
+        
+        for i, f in enumerate(files):
+            lines = f.get("lines", 0)
+            if lines > 500:
+                large.append(f)
+                if lines > 1000:
+                    god.append(f)
+            
+            ext = f.get("extension")
+            if ext in (".ts", ".tsx"):
+                ts.append(f)
+            elif ext in (".js", ".jsx"):
+                js.append(f)
+            
+            flags = _classify_path(f.get("relative_path", ""))
+            if flags & _PATH_TEST:
+                test.append(f)
+            
+            if f.get("language") != "Unknown":
+                source.append(f)
+            
+            # Secret scan only looks at the first 100 entries
+            if i < 100 and ext in (".js", ".ts", ".py", ".json"):
+                secret_candidates.append(f)
+            
+            if flags & _PATH_AUTH:
+                buckets.has_auth = True
+            if flags & _PATH_API_DOC:
+                buckets.has_api_docs = True
+        
+        return buckets
+    
+    def _evaluate_code_quality(self, source: Path, entries: dict, buckets: FileBuckets, config: dict) -> CategoryScore:
         """Evaluate code quality"""
         score = 70  # Base score
         issues = []
         recommendations = []
         
         # Check for large files
-        large_files = [f for f in files if f.get("lines", 0) > 500]
+        large_files = buckets.large
         if large_files:
             score -= min(len(large_files) * 5, 20)
             for lf in large_files[:3]:
@@ -186,7 +422,7 @@ class HealthEvaluator:
                 })
         
         # Check for very long files (likely god classes)
-        god_files = [f for f in files if f.get("lines", 0) > 1000]
+        god_files = buckets.god
         if god_files:
             score -= min(len(god_files) * 10, 30)
             for gf in god_files[:3]:
@@ -201,8 +437,8 @@ class HealthEvaluator:
                 })
         
         # Check for TypeScript adoption
-        ts_files = [f for f in files if f.get("extension") in [".ts", ".tsx"]]
-        js_files = [f for f in files if f.get("extension") in [".js", ".jsx"]]
+        ts_files = buckets.ts
+        js_files = buckets.js
         
         if js_files and not ts_files:
             score -= 10
@@ -213,8 +449,8 @@ class HealthEvaluator:
                 recommendations.append("Continue TypeScript migration")
         
         # Check for linting config
-        has_eslint = (source / ".eslintrc").exists() or (source / ".eslintrc.js").exists() or (source / ".eslintrc.json").exists()
-        has_prettier = (source / ".prettierrc").exists() or (source / ".prettierrc.js").exists()
+        has_eslint = ".eslintrc" in entries or ".eslintrc.js" in entries or ".eslintrc.json" in entries
+        has_prettier = ".prettierrc" in entries or ".prettierrc.js" in entries
         
         if not has_eslint:
             score -= 10
@@ -231,7 +467,7 @@ class HealthEvaluator:
             recommendations=recommendations
         )
     
-    def _evaluate_test_coverage(self, source: Path, files: list, config: dict) -> CategoryScore:
+    def _evaluate_test_coverage(self, source: Path, buckets: FileBuckets, config: dict) -> CategoryScore:
         """Evaluate test coverage"""
         score = 50  # Base score (assumes no tests)
         issues = []
@@ -240,14 +476,8 @@ class HealthEvaluator:
         # Check if tests exist
         has_tests = config.get("features", {}).get("has_tests", False)
         
-        test_files = [f for f in files if 
-                      ".test." in f.get("relative_path", "") or
-                      ".spec." in f.get("relative_path", "") or
-                      "_test." in f.get("relative_path", "") or
-                      "/test/" in f.get("relative_path", "") or
-                      "/tests/" in f.get("relative_path", "")]
-        
-        source_files = [f for f in files if f.get("language") != "Unknown"]
+        test_files = buckets.test
+        source_files = buckets.source
         
         if not has_tests and not test_files:
             score = 10
@@ -299,21 +529,19 @@ class HealthEvaluator:
             recommendations=recommendations
         )
     
-    def _evaluate_security(self, source: Path, files: list, config: dict) -> CategoryScore:
+    def _evaluate_security(self, source: Path, entries: dict, buckets: FileBuckets, config: dict) -> CategoryScore:
         """Evaluate security posture"""
         score = 80  # Base score
         issues = []
         recommendations = []
         
         # Check for .env file committed (should be .env.example)
-        if (source / ".env").exists():
+        if ".env" in entries:
             # Check if it's in gitignore
-            gitignore = source / ".gitignore"
             env_ignored = False
-            if gitignore.exists():
-                with open(gitignore, encoding="utf-8") as f:
-                    if ".env" in f.read():
-                        env_ignored = True
+            if ".gitignore" in entries:
+                if ".env" in _read_cached(source / ".gitignore", str):
+                    env_ignored = True
             
             if not env_ignored:
                 score -= 20
@@ -327,28 +555,25 @@ class HealthEvaluator:
                     "effort": "30 minutes"
                 })
         
-        # Check for hardcoded secrets patterns (simplified)
-        secret_patterns = ["api_key", "apikey", "secret", "password", "token", "credential"]
-        
-        for f in files[:100]:  # Check first 100 files
-            file_path = source / f.get("relative_path", "")
-            if file_path.exists() and f.get("extension") in [".js", ".ts", ".py", ".json"]:
-                try:
-                    with open(file_path, encoding="utf-8", errors="ignore") as fp:
-                        content = fp.read().lower()
-                        for pattern in secret_patterns:
-                            if f'"{pattern}"' in content or f"'{pattern}'" in content:
-                                if "example" not in f.get("relative_path", "").lower():
-                                    score -= 5
-                                    break
-                except:
-                    pass
+        # Check for hardcoded secrets patterns (simplified) - scannable
+        # files among the first 100, read concurrently
+        if buckets.secret_candidates:
+            pool = ThreadPoolExecutor(max_workers=SECRET_SCAN_WORKERS)
+            try:
+                for hit in pool.map(lambda f: self._has_secret(source, f), buckets.secret_candidates):
+                    if hit:
+                        score -= 5
+                        # The reported score is clamped at 0, so further
+                        # hits can't change anything - skip the rest
+                        if score <= 0:
+                            break
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
         
         # Check for HTTPS usage in configs
         # Check for authentication middleware indicators
         
-        has_auth = any("auth" in f.get("relative_path", "").lower() for f in files)
-        if not has_auth:
+        if not buckets.has_auth:
             recommendations.append("Ensure authentication is properly implemented")
         
         return CategoryScore(
@@ -359,43 +584,50 @@ class HealthEvaluator:
             recommendations=recommendations
         )
     
-    def _evaluate_dependencies(self, source: Path, config: dict) -> CategoryScore:
+    def _has_secret(self, source: Path, f: dict) -> bool:
+        """Whether a non-example file contains a quoted secret-like key"""
+        if "example" in f.get("relative_path", "").lower():
+            return False
+        
+        # Missing (and empty) files just fail to open/map - no separate
+        # exists() stat. Mapping scans the bytes in place, no copy.
+        try:
+            with open(source / f.get("relative_path", ""), "rb") as fp:
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self._SECRET_RE.search(mm) is not None
+        except:
+            return False
+    
+    def _evaluate_dependencies(self, source: Path, entries: dict, config: dict) -> CategoryScore:
         """Evaluate dependency health"""
         score = 70  # Base score
         issues = []
         recommendations = []
         
         # Check package.json
-        package_json = source / "package.json"
-        if package_json.exists():
+        if "package.json" in entries:
             try:
-                with open(package_json, encoding="utf-8") as f:
-                    pkg = json.load(f)
+                pkg = _read_cached(source / "package.json", _json_loads)
                 
                 deps = pkg.get("dependencies", {})
-                dev_deps = pkg.get("devDependencies", {})
-                all_deps = {**deps, **dev_deps}
                 
                 # Check for very old React
                 if "react" in deps:
-                    version = deps["react"].replace("^", "").replace("~", "").split(".")[0]
-                    try:
-                        if int(version) < 18:
-                            score -= 15
-                            issues.append({
-                                "severity": "medium",
-                                "category": "dependencies",
-                                "title": f"Outdated React version: {deps['react']}",
-                                "location": "package.json",
-                                "description": "React version is behind current (19)",
-                                "fix": "Upgrade React following migration guide",
-                                "effort": "4-16 hours"
-                            })
-                    except:
-                        pass
+                    major = _VER_MAJOR.match(deps["react"])
+                    if major and int(major.group(1)) < 18:
+                        score -= 15
+                        issues.append({
+                            "severity": "medium",
+                            "category": "dependencies",
+                            "title": f"Outdated React version: {deps['react']}",
+                            "location": "package.json",
+                            "description": "React version is behind current (19)",
+                            "fix": "Upgrade React following migration guide",
+                            "effort": "4-16 hours"
+                        })
                 
                 # Check for lock file
-                has_lock = (source / "package-lock.json").exists() or (source / "yarn.lock").exists() or (source / "pnpm-lock.yaml").exists()
+                has_lock = "package-lock.json" in entries or "yarn.lock" in entries or "pnpm-lock.yaml" in entries
                 if not has_lock:
                     score -= 10
                     issues.append({
@@ -413,10 +645,9 @@ class HealthEvaluator:
         
         # Check requirements.txt for Python
         requirements = source / "requirements.txt"
-        if requirements.exists():
+        if "requirements.txt" in entries:
             try:
-                with open(requirements, encoding="utf-8") as f:
-                    lines = f.readlines()
+                lines = requirements.read_text(encoding="utf-8").splitlines()
                 
                 # Check for pinned versions
                 unpinned = [l.strip() for l in lines if l.strip() and not any(c in l for c in ["==", ">=", "<=", ">", "<"])]
@@ -434,21 +665,22 @@ class HealthEvaluator:
             recommendations=recommendations
         )
     
-    def _evaluate_documentation(self, source: Path, files: list, config: dict) -> CategoryScore:
+    def _evaluate_documentation(self, source: Path, entries: dict, buckets: FileBuckets, config: dict) -> CategoryScore:
         """Evaluate documentation"""
         score = 50  # Base score
         issues = []
         recommendations = []
         
         # Check for README
-        has_readme = (source / "README.md").exists() or (source / "README.rst").exists()
+        has_readme = "README.md" in entries or "README.rst" in entries
         if has_readme:
             score += 20
             # Check README length
-            readme_path = source / "README.md" if (source / "README.md").exists() else source / "README.rst"
+            readme_path = source / "README.md" if "README.md" in entries else source / "README.rst"
             try:
-                with open(readme_path, encoding="utf-8") as f:
-                    readme_lines = len(f.readlines())
+                # Count newline bytes rather than building a list of lines
+                raw = readme_path.read_bytes()
+                readme_lines = raw.count(b"\n") + (1 if raw and not raw.endswith(b"\n") else 0)
                 if readme_lines < 20:
                     score -= 10
                     recommendations.append("Expand README with setup instructions and usage")
@@ -469,19 +701,13 @@ class HealthEvaluator:
             })
         
         # Check for API documentation
-        has_api_docs = any("api" in f.get("relative_path", "").lower() and 
-                          ("doc" in f.get("relative_path", "").lower() or
-                           "swagger" in f.get("relative_path", "").lower() or
-                           "openapi" in f.get("relative_path", "").lower())
-                          for f in files)
-        
-        if not has_api_docs:
+        if not buckets.has_api_docs:
             recommendations.append("Add API documentation (OpenAPI/Swagger)")
         else:
             score += 15
         
         # Check for CHANGELOG
-        has_changelog = (source / "CHANGELOG.md").exists() or (source / "HISTORY.md").exists()
+        has_changelog = "CHANGELOG.md" in entries or "HISTORY.md" in entries
         if has_changelog:
             score += 10
         else:
@@ -495,15 +721,16 @@ class HealthEvaluator:
             recommendations=recommendations
         )
     
-    def _evaluate_architecture(self, source: Path, files: list, config: dict) -> CategoryScore:
+    def _evaluate_architecture(self, source: Path, entries: dict, buckets: FileBuckets, config: dict) -> CategoryScore:
         """Evaluate architecture"""
         score = 70  # Base score
         issues = []
         recommendations = []
         
-        # Check for clear structure
-        has_src = (source / "src").exists()
-        has_lib = (source / "lib").exists()
+        # Check for clear structure - DirEntry.is_dir() reuses the type
+        # scandir already reported, so this costs no extra stat()
+        has_src = "src" in entries and entries["src"].is_dir()
+        has_lib = "lib" in entries and entries["lib"].is_dir()
         
         if not has_src and not has_lib:
             score -= 10
@@ -517,7 +744,10 @@ class HealthEvaluator:
         
         # Check for config separation
         config_files = config.get("config_files", [])
-        has_config_dir = (source / "config").exists() or (source / "src" / "config").exists()
+        # Only list src/ when the top-level check didn't already settle it
+        has_config_dir = ("config" in entries and entries["config"].is_dir()) or (
+            has_src and "config" in self._scan_dir(source / "src")
+        )
         
         if not has_config_dir and len(config_files) > 3:
             recommendations.append("Consider organizing config files into config/ directory")
@@ -559,22 +789,16 @@ class HealthEvaluator:
         total_hours = 0
         
         for issue in issues:
-            effort = issue.get("effort", "")
+            effort = issue.get("effort", "").lower()
             # Parse effort string
-            if "hour" in effort.lower():
-                try:
-                    parts = effort.lower().replace("hours", "").replace("hour", "").strip()
-                    if "-" in parts:
-                        low, high = parts.split("-")
-                        total_hours += (int(low.strip()) + int(high.strip())) / 2
-                    else:
-                        total_hours += int(parts.strip())
-                except:
-                    total_hours += 4  # Default estimate
-            elif "minute" in effort.lower():
+            match = _EFFORT_HOURS_RE.fullmatch(effort)
+            if match:
+                low, high = match.groups()
+                total_hours += (int(low) + int(high)) / 2 if high else int(low)
+            elif "minute" in effort and "hour" not in effort:
                 total_hours += 0.5
             else:
-                total_hours += 4
+                total_hours += 4  # Default estimate
         
         if total_hours < 10:
             return f"{int(total_hours)}-{int(total_hours * 1.5)} hours"
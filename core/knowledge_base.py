@@ -14,6 +14,11 @@ import chromadb
 from chromadb.config import Settings
 
 
+# Incremental indexing record kept by EnhancedCodeIndexer in persist_directory;
+# it describes this store's contents, so clear() removes it too
+MANIFEST_NAME = "index_manifest.json"
+
+
 @dataclass
 class Document:
     """A document in the knowledge base"""
@@ -89,28 +94,52 @@ class KnowledgeBase:
         doc_id: str | None = None
     ) -> str:
         """Add a document to the knowledge base"""
-        
-        if doc_id is None:
-            doc_id = self._generate_doc_id(content, doc_type)
-        
-        base_metadata = {
+        return self.add_documents([{
+            "content": content,
             "doc_type": doc_type,
-            "project_id": self.project_id,
-            "timestamp": datetime.now().isoformat(),
-            "file_path": file_path or ""
-        }
-        
-        if metadata:
-            base_metadata.update(metadata)
-        
-        # Upsert to handle updates
-        self.collection.upsert(
-            ids=[doc_id],
-            documents=[content],
-            metadatas=[base_metadata]
-        )
+            "metadata": metadata,
+            "file_path": file_path,
+            "doc_id": doc_id,
+        }])[0]
+    
+    def add_documents(self, documents: list[dict]) -> list[str]:
+        """
+        Add several documents in one upsert, so they are embedded as a batch.
+        Each dict takes the add_document arguments; returns the document IDs.
+        """
+        timestamp = datetime.now().isoformat()
+        doc_ids = []
+        records = {}
+        
+        for document in documents:
+            content = document["content"]
+            doc_type = document["doc_type"]
+            doc_id = document.get("doc_id") or self._generate_doc_id(content, doc_type)
+            
+            base_metadata = {
+                "doc_type": doc_type,
+                "project_id": self.project_id,
+                "timestamp": timestamp,
+                "file_path": document.get("file_path") or ""
+            }
+            
+            if document.get("metadata"):
+                base_metadata.update(document["metadata"])
+            
+            # Repeated IDs keep the last version, as separate upserts would
+            records.pop(doc_id, None)
+            records[doc_id] = (content, base_metadata)
+            doc_ids.append(doc_id)
+        
+        if records:
+            # Upsert to handle updates
+            self.collection.upsert(
+                ids=list(records),
+                documents=[content for content, _ in records.values()],
+                metadatas=[metadata for _, metadata in records.values()]
+            )
         
-        return doc_id
+        return doc_ids
     
     def add_file(self, file_path: str, doc_type: str, metadata: dict | None = None) -> str:
         """Add a file to the knowledge base"""
@@ -225,6 +254,15 @@ class KnowledgeBase:
         """Delete a document from the knowledge base"""
         self.collection.delete(ids=[doc_id])
     
+    def delete_file_documents(self, file_path: str):
+        """Delete every document indexed from a file"""
+        self.collection.delete(where={"file_path": file_path})
+    
+    def indexed_file_paths(self) -> set[str]:
+        """file_path of every document in the knowledge base"""
+        results = self.collection.get(include=["metadatas"])
+        return {metadata.get("file_path") for metadata in results["metadatas"] or ()}
+    
     def get_all_by_type(self, doc_type: str) -> list[Document]:
         """Get all documents of a specific type"""
         results = self.collection.get(
@@ -267,6 +305,7 @@ class KnowledgeBase:
             name=f"project_{self.project_id}",
             metadata={"hnsw:space": "cosine"}
         )
+        (self.persist_directory / MANIFEST_NAME).unlink(missing_ok=True)
 
 
 class ContextManager:
@@ -9,6 +9,7 @@ Stores:
 
 import yaml
 import uuid
+from contextlib import contextmanager
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
 from typing import Optional
@@ -92,6 +93,8 @@ class LessonsDatabase:
     def __init__(self, path: Optional[Path] = None):
         self.path = Path(path) if path else self.DEFAULT_PATH
         self.data = self._load()
+        self._defer_depth = 0
+        self._save_pending = False
 
     def _load(self) -> dict:
         """Load lessons from YAML file."""
@@ -120,7 +123,12 @@ class LessonsDatabase:
         }
 
     def save(self) -> None:
-        """Save lessons to YAML file."""
+        """Save lessons to YAML file (postponed inside deferred_save)."""
+        if self._defer_depth:
+            self._save_pending = True
+            return
+        self._save_pending = False
+
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
         # Update metadata
@@ -136,6 +144,17 @@ class LessonsDatabase:
         with open(self.path, "w", encoding="utf-8") as f:
             yaml.dump(self.data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
+    @contextmanager
+    def deferred_save(self):
+        """Collapse every save() inside the block into one write at the end."""
+        self._defer_depth += 1
+        try:
+            yield self
+        finally:
+            self._defer_depth -= 1
+            if not self._defer_depth and self._save_pending:
+                self.save()
+
     # ========== Lessons ==========
 
     def get_lessons(self, step_name: str) -> list[Lesson]:
@@ -183,7 +183,7 @@ class ContextAwareVoting:
             decision_summary=decision_summary,
             actor=gate_name,
             actor_type="voting_gate",
-            precedents_matched=[asdict(p) for p in precedents_used],
+            precedents_matched=precedents_used,
             conflicts_resolved=conflicts,
             conditions=conditions,
             tags=tags,